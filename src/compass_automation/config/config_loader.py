@@ -15,6 +15,21 @@ except json.JSONDecodeError as e:
     raise RuntimeError(f"[CONFIG] Invalid JSON format in {CONFIG_PATH}: {e}")
 
 
+def _flatten(node: dict, prefix: str = "") -> dict:
+    """Map every dotted key path (leaves and subtrees) to its value."""
+    flat = {}
+    for k, v in node.items():
+        path = f"{prefix}{k}"
+        flat[path] = v
+        if isinstance(v, dict):
+            flat.update(_flatten(v, f"{path}."))
+    return flat
+
+
+# Precomputed dotted-key index so lookups are a single dict hit
+_FLAT_CONFIG = _flatten(_CONFIG)
+
+
 def get_config(key: str, default: Any = None) -> Any:
     """
     Retrieve a config value by key, supporting dot notation for nested keys.
@@ -26,22 +41,13 @@ def get_config(key: str, default: Any = None) -> Any:
     Returns:
         The value from config.json or the default if provided.
     """
-    # Handle nested keys with dot notation
-    if '.' in key:
-        keys = key.split('.')
-        value = _CONFIG
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            if default is None:
+    try:
+        return _FLAT_CONFIG[key]
+    except KeyError:
+        if default is None:
+            if '.' in key:
                 raise KeyError(f"[CONFIG] Missing nested key: '{key}' in {CONFIG_PATH}")
-            return default
-    
-    # Handle simple keys
-    if key not in _CONFIG and default is None:
-        raise KeyError(f"[CONFIG] Missing key: '{key}' in {CONFIG_PATH}")
-    return _CONFIG.get(key, default)
+            raise KeyError(f"[CONFIG] Missing key: '{key}' in {CONFIG_PATH}")
+        return default
 
 DEFAULT_TIMEOUT = _CONFIG.get("delay_seconds", 8)
@@ -5,6 +5,8 @@ This module automatically downloads and maintains the correct version of msedged
 to match the installed Edge browser version.
 """
 
+import functools
+import json
 import os
 import re
 import shutil
@@ -12,8 +14,9 @@ import subprocess
 import sys
 import time
 import zipfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from urllib.request import urlopen
 
 from compass_automation.utils.logger import log
@@ -21,33 +24,108 @@ from compass_automation.utils.logger import log
 
 from compass_automation.utils.project_paths import ProjectPaths
 
+try:
+    import win32api  # pywin32 (Windows only) - reads PE version info without spawning the driver
+except ImportError:
+    win32api = None
+
+
+_VERSION_RE = re.compile(r"(\d+(?:\.\d+)*)")
+
+
+@dataclass(frozen=True, slots=True)
+class DriverVersion:
+    """Parsed browser/driver version (e.g., 143.0.3650.80 -> (143, 0, 3650, 80))."""
+
+    parts: Tuple[int, ...]
+
+    @property
+    def major(self) -> int:
+        return self.parts[0]
+
+    @classmethod
+    def parse(cls, text: Optional[str]) -> Optional["DriverVersion"]:
+        """Parse a dotted version string; return None for 'unknown' or unparsable input."""
+        if not text:
+            return None
+        match = _VERSION_RE.search(text)
+        if not match:
+            return None
+        return cls(tuple(int(p) for p in match.group(1).split(".")))
+
+    def __str__(self) -> str:
+        return ".".join(map(str, self.parts))
+
 
 class DriverDownloader:
     """Automatically downloads and manages Edge WebDriver versions."""
 
     DRIVER_DOWNLOAD_URL = "https://edgedriver.microsoft.com/download/{version}"
     DRIVER_PATH = ProjectPaths.get_project_root() / "msedgedriver.exe"
+    STAMP_PATH = DRIVER_PATH.with_name("msedgedriver.ok")
+
+    @staticmethod
+    def _read_stamp() -> Optional[dict]:
+        """Return the last verified {mtime, major} stamp, or None if absent/unreadable."""
+        try:
+            with open(DriverDownloader.STAMP_PATH, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_stamp(browser_major: int) -> None:
+        """Record the driver mtime and browser major that were verified to match."""
+        try:
+            with open(DriverDownloader.STAMP_PATH, "w") as f:
+                json.dump(
+                    {
+                        "mtime": os.path.getmtime(DriverDownloader.DRIVER_PATH),
+                        "major": browser_major,
+                    },
+                    f,
+                )
+        except OSError as e:
+            log.debug("[DRIVER] Could not write driver stamp: %s", e)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_browser_version() -> str:
-        """Return installed Edge browser version from Windows registry."""
+        """Return installed Edge browser version from Windows registry (read once per process)."""
         try:
             import winreg
-            key = winreg.OpenKey(
+            with winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
-                r"Software\Microsoft\Edge\BLBeacon"
-            )
-            value, _ = winreg.QueryValueEx(key, "version")
+                r"Software\Microsoft\Edge\BLBeacon",
+                0,
+                winreg.KEY_READ | winreg.KEY_WOW64_64KEY,
+            ) as key:
+                value, _ = winreg.QueryValueEx(key, "version")
             return value
         except Exception as e:
-            log.error(f"[DRIVER] Failed to get browser version from registry: {e}")
+            log.error("[DRIVER] Failed to get browser version from registry: %s", e)
             return "unknown"
 
+    @staticmethod
+    def get_file_version(driver_path) -> Optional[str]:
+        """Return the PE file version of driver_path, or None if it can't be read directly."""
+        if win32api is None:
+            return None
+        try:
+            info = win32api.GetFileVersionInfo(str(driver_path), "\\")
+            ms, ls = info["FileVersionMS"], info["FileVersionLS"]
+            return f"{ms >> 16}.{ms & 0xFFFF}.{ls >> 16}.{ls & 0xFFFF}"
+        except Exception:
+            return None
+
     @staticmethod
     def get_driver_version(driver_path: Path) -> str:
         """Return Edge WebDriver version (e.g., 143.0.x.x)."""
         if not driver_path.exists():
             return "unknown"
+        file_version = DriverDownloader.get_file_version(driver_path)
+        if file_version:
+            return file_version
         try:
             output = subprocess.check_output(
                 [str(driver_path), "--version"],
@@ -59,7 +137,7 @@ class DriverDownloader:
                 return match.group(1)
             return "unknown"
         except Exception as e:
-            log.error(f"[DRIVER] Failed to extract driver version: {e}")
+            log.error("[DRIVER] Failed to extract driver version: %s", e)
             return "unknown"
 
     @staticmethod
@@ -78,7 +156,7 @@ class DriverDownloader:
         
         try:
             url = DriverDownloader.DRIVER_DOWNLOAD_URL.format(version=version)
-            log.info(f"[DRIVER] Downloading driver v{version} from {url}")
+            log.info("[DRIVER] Downloading driver v%s from %s", version, url)
 
             # Create temp directory for extraction
             temp_dir = target_path.parent / ".driver_temp"
@@ -86,7 +164,7 @@ class DriverDownloader:
 
             # Download zip file with retry logic
             zip_path = temp_dir / "msedgedriver.zip"
-            log.info(f"[DRIVER] Downloading to {zip_path}")
+            log.info("[DRIVER] Downloading to %s", zip_path)
 
             max_retries = 3
             retry_count = 0
@@ -103,14 +181,15 @@ class DriverDownloader:
                     if retry_count < max_retries:
                         wait_time = 2 ** retry_count  # Exponential backoff
                         log.warning(
-                            f"[DRIVER] Network error (attempt {retry_count}/{max_retries}): {net_error}. "
-                            f"Retrying in {wait_time} seconds..."
+                            "[DRIVER] Network error (attempt %s/%s): %s. "
+                            "Retrying in %s seconds...",
+                            retry_count, max_retries, net_error, wait_time,
                         )
                         time.sleep(wait_time)
                     else:
                         raise
 
-            log.info(f"[DRIVER] Download complete, extracting...")
+            log.info("[DRIVER] Download complete, extracting...")
 
             # Extract the driver
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
@@ -127,12 +206,12 @@ class DriverDownloader:
                             backup_path = target_path.with_stem(
                                 f"{target_path.stem}_backup"
                             )
-                            log.info(f"[DRIVER] Backing up existing driver to {backup_path}")
+                            log.info("[DRIVER] Backing up existing driver to %s", backup_path)
                             shutil.copy2(target_path, backup_path)
 
                         # Move extracted driver to target location
                         shutil.move(str(extracted_driver), str(target_path))
-                        log.info(f"[DRIVER] Driver installed to {target_path}")
+                        log.info("[DRIVER] Driver installed to %s", target_path)
 
                         # Cleanup temp directory
                         shutil.rmtree(temp_dir, ignore_errors=True)
@@ -143,11 +222,12 @@ class DriverDownloader:
             return False
 
         except Exception as e:
-            log.error(f"[DRIVER] Download failed: {e}")
+            log.error("[DRIVER] Download failed: %s", e)
             # Provide helpful troubleshooting info
             log.error(
-                f"[DRIVER] Troubleshooting: Check network/firewall, or manually download from "
-                f"https://edgedriver.microsoft.com/download/{version}"
+                "[DRIVER] Troubleshooting: Check network/firewall, or manually download from "
+                "https://edgedriver.microsoft.com/download/%s",
+                version,
             )
             return False
 
@@ -167,40 +247,56 @@ class DriverDownloader:
             log.warning("[DRIVER] Could not detect browser version - skipping auto-update")
             return DriverDownloader.DRIVER_PATH.exists()
 
+        browser_parsed = DriverVersion.parse(browser_ver)
+
+        # Skip the driver --version probe if this exact binary was already verified
+        stamp = DriverDownloader._read_stamp()
+        if stamp and browser_parsed and DriverDownloader.DRIVER_PATH.exists():
+            if (
+                stamp.get("mtime") == os.path.getmtime(DriverDownloader.DRIVER_PATH)
+                and stamp.get("major") == browser_parsed.major
+            ):
+                log.info("[DRIVER] ✅ Driver stamp matches browser v%s", browser_parsed.major)
+                return True
+
         driver_ver = DriverDownloader.get_driver_version(DriverDownloader.DRIVER_PATH)
 
-        log.info(f"[DRIVER] Browser v{browser_ver}, Driver v{driver_ver}")
+        log.info("[DRIVER] Browser v%s, Driver v%s", browser_ver, driver_ver)
 
         # Compare major versions
-        browser_major = browser_ver.split(".")[0]
-        driver_major = driver_ver.split(".")[0] if driver_ver != "unknown" else "0"
+        driver_parsed = DriverVersion.parse(driver_ver)
 
-        if browser_major == driver_major:
-            log.info(f"[DRIVER] ✅ Driver version matches browser")
+        if browser_parsed and driver_parsed and browser_parsed.major == driver_parsed.major:
+            log.info("[DRIVER] ✅ Driver version matches browser")
+            DriverDownloader._write_stamp(browser_parsed.major)
             return True
 
         # Version mismatch - attempt to download correct version
         log.warning(
-            f"[DRIVER] Version mismatch: browser={browser_ver}, driver={driver_ver}"
+            "[DRIVER] Version mismatch: browser=%s, driver=%s", browser_ver, driver_ver
         )
-        log.info(f"[DRIVER] Attempting to download driver v{browser_ver}...")
+        log.info("[DRIVER] Attempting to download driver v%s...", browser_ver)
 
         if DriverDownloader.download_driver(browser_ver, DriverDownloader.DRIVER_PATH):
-            log.info(f"[DRIVER] ✅ Driver updated to v{browser_ver}")
+            log.info("[DRIVER] ✅ Driver updated to v%s", browser_ver)
+            if browser_parsed:
+                DriverDownloader._write_stamp(browser_parsed.major)
             return True
         else:
             # Download failed, but let's check if existing driver is usable
             if DriverDownloader.DRIVER_PATH.exists():
                 log.warning(
-                    f"[DRIVER] ⚠️  Download failed, but existing driver found. "
-                    f"System may work with v{driver_ver}, but best practice is to update. "
-                    f"Manual download: https://edgedriver.microsoft.com/download/{browser_ver}"
+                    "[DRIVER] ⚠️  Download failed, but existing driver found. "
+                    "System may work with v%s, but best practice is to update. "
+                    "Manual download: https://edgedriver.microsoft.com/download/%s",
+                    driver_ver, browser_ver,
                 )
                 return True  # Proceed with caution
             else:
                 log.error(
-                    f"[DRIVER] ❌ Failed to download driver v{browser_ver} and no existing driver found. "
-                    f"Manual download required: https://edgedriver.microsoft.com/download/{browser_ver}"
+                    "[DRIVER] ❌ Failed to download driver v%s and no existing driver found. "
+                    "Manual download required: https://edgedriver.microsoft.com/download/%s",
+                    browser_ver, browser_ver,
                 )
                 return False
 
@@ -1,31 +1,51 @@
+import atexit
+import functools
+import shutil
 import subprocess
 import re
 import os
+import tempfile
 import winreg
 import logging
+import threading
+from pathlib import Path
 from selenium import webdriver
-from selenium.common.exceptions import SessionNotCreatedException
+from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
 from selenium.webdriver.edge.service import Service
 
-from compass_automation.core.driver_downloader import DriverDownloader
+from compass_automation.core.driver_downloader import DriverDownloader, DriverVersion
 
 DRIVER_PATH = str(DriverDownloader.DRIVER_PATH)
+# Persistent Edge profile: first-run/profile bootstrap is paid once, not on every launch
+PROFILE_DIR = Path.home() / ".compass_auto_profile"
+# Foundry app and its Microsoft SSO: their stored state is wiped at launch so each run logs in fresh
+_SESSION_ORIGINS = (
+    "https://avisbudget.palantirfoundry.com",
+    "https://login.microsoftonline.com",
+)
 # Logger
 
 log = logging.getLogger("mc.automation")
 
 _driver = None  # singleton instance
+_driver_lock = threading.Lock()  # guards creation when launched from a worker thread
 
 
 
 
 
 
+@functools.lru_cache(maxsize=1)
 def get_browser_version() -> str:
-    """Return installed Edge browser version from Windows registry."""
+    """Return installed Edge browser version from Windows registry (read once per process)."""
     try:
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Edge\BLBeacon")
-        value, _ = winreg.QueryValueEx(key, "version")
+        with winreg.OpenKey(
+            winreg.HKEY_CURRENT_USER,
+            r"Software\Microsoft\Edge\BLBeacon",
+            0,
+            winreg.KEY_READ | winreg.KEY_WOW64_64KEY,
+        ) as key:
+            value, _ = winreg.QueryValueEx(key, "version")
         return value
     except Exception as e:
         print(f"Error: {e}")
@@ -45,56 +65,112 @@ if __name__ == "__main__":
 def get_driver_version(driver_path: str) -> str:
     """Return Edge WebDriver version (e.g., 140.0.x.x)."""
     if not os.path.exists(driver_path):
-        log.error(f"[DRIVER] Driver binary not found at {driver_path}")
+        log.error("[DRIVER] Driver binary not found at %s", driver_path)
         return "unknown"
+    file_version = DriverDownloader.get_file_version(driver_path)
+    if file_version:
+        return file_version
     try:
         output = subprocess.check_output([driver_path, "--version"], text=True)
         return re.search(r"(\d+\.\d+\.\d+\.\d+)", output).group(1)
     except Exception as e:
-        log.error(f"[DRIVER] Failed to get driver version from {driver_path} → {e}")
+        log.error("[DRIVER] Failed to get driver version from %s → %s", driver_path, e)
         return "unknown"
 
 
 def get_or_create_driver():
-    """Return singleton Edge WebDriver, creating it if needed."""
+    """Return singleton Edge WebDriver, creating it if needed (thread-safe)."""
     global _driver
     if _driver:
         return _driver
 
+    with _driver_lock:
+        if not _driver:
+            _driver = create_driver()
+        return _driver
+
+
+def create_driver(user_data_dir: str = None):
+    """
+    Check versions and launch a new Edge WebDriver (not the singleton).
+
+    Args:
+        user_data_dir: Profile directory (default PROFILE_DIR); give each parallel
+            instance its own, since Edge locks a profile to one process. If the
+            profile is locked by another run, a temporary profile is used instead.
+    """
     browser_ver = get_browser_version()
     driver_ver = get_driver_version(DRIVER_PATH)
 
     # Always log detected versions
-    log.info(f"[DRIVER] Detected Browser={browser_ver}, Driver={driver_ver}")
+    log.info("[DRIVER] Detected Browser=%s, Driver=%s", browser_ver, driver_ver)
 
     # Compare before launching browser
-    if browser_ver.split(".")[0] != driver_ver.split(".")[0]:
+    browser_parsed = DriverVersion.parse(browser_ver)
+    driver_parsed = DriverVersion.parse(driver_ver)
+    if not (browser_parsed and driver_parsed and browser_parsed.major == driver_parsed.major):
         log.warning(
-            f"[DRIVER] Version mismatch → Browser {browser_ver}, Driver {driver_ver}. "
-            f"Proceeding with caution. Run 'python manage_driver.py --download' to update."
+            "[DRIVER] Version mismatch → Browser %s, Driver %s. "
+            "Proceeding with caution. Run 'python manage_driver.py --download' to update.",
+            browser_ver, driver_ver,
         )
     else:
-        log.info(f"[DRIVER] ✅ Versions match")
+        log.info("[DRIVER] ✅ Versions match")
 
+    profile = str(user_data_dir or PROFILE_DIR)
     try:
-        log.info(f"[DRIVER] Launching Edge → Browser {browser_ver}, Driver {driver_ver}")
-        options = webdriver.EdgeOptions()
-        options.add_argument("--inprivate")
-        options.add_argument("--start-maximized")
-        options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values.geolocation": 2 }) 
-        
-        if os.path.exists(DRIVER_PATH):
-            service = Service(DRIVER_PATH)
-            _driver = webdriver.Edge(service=service, options=options)
-        else:
-            log.warning(f"[DRIVER] Driver not found at {DRIVER_PATH}, falling back to Selenium Manager")
-            _driver = webdriver.Edge(options=options)
-            
-        return _driver
+        driver = _launch_edge(browser_ver, driver_ver, profile)
     except SessionNotCreatedException as e:
-        log.error(f"[DRIVER] Session creation failed: {e}")
-        raise
+        if "already in use" not in str(e):
+            log.error("[DRIVER] Session creation failed: %s", e)
+            raise
+        # Another run holds the profile lock; fall back to a throwaway profile for this one
+        log.warning("[DRIVER] Profile %s is locked by another Edge; using a temporary profile", profile)
+        profile = tempfile.mkdtemp(prefix="compass_auto_profile_")
+        atexit.register(shutil.rmtree, profile, True)
+        driver = _launch_edge(browser_ver, driver_ver, profile)
+    _clear_session_state(driver)
+    return driver
+
+
+def _launch_edge(browser_ver: str, driver_ver: str, user_data_dir: str):
+    """Start Edge on user_data_dir with the automation options."""
+    log.info("[DRIVER] Launching Edge → Browser %s, Driver %s", browser_ver, driver_ver)
+    options = webdriver.EdgeOptions()
+    # Return at DOMContentLoaded; Navigator.verify still waits for readyState=complete
+    options.page_load_strategy = "eager"
+    options.add_argument(f"--user-data-dir={user_data_dir}")
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    options.add_argument("--disable-component-update")
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-default-apps")
+    options.add_experimental_option("prefs", {
+        "profile.default_content_setting_values.geolocation": 2 }) 
+
+    if os.path.exists(DRIVER_PATH):
+        service = Service(DRIVER_PATH)
+        return webdriver.Edge(service=service, options=options)
+    log.warning("[DRIVER] Driver not found at %s, falling back to Selenium Manager", DRIVER_PATH)
+    return webdriver.Edge(options=options)
+
+
+def _clear_session_state(driver) -> None:
+    """
+    Drop the login state left in the persistent profile so each run starts logged out:
+    all cookies, plus local/session storage, IndexedDB, caches and service workers
+    of the Foundry and SSO origins.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in _SESSION_ORIGINS:
+            driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+            )
+    except WebDriverException as e:
+        log.warning("[DRIVER] Could not clear profile session state: %s", e)
 
 
 def quit_driver():
@@ -107,6 +183,6 @@ def quit_driver():
             if callable(quit_fn):
                 quit_fn()
             else:
-                log.warning(f"[DRIVER] Singleton driver has no quit(): {_driver!r}")
+                log.warning("[DRIVER] Singleton driver has no quit(): %r", _driver)
         finally:
             _driver = None
@@ -1,3 +1,4 @@
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
@@ -10,7 +11,7 @@ class Navigator:
 
     def go_to(self, url: str, label: str = "page", verify: bool = True):
         """Navigate to a URL. Optionally call verify afterwards."""
-        log.info(f"[NAV] Navigating to {label} → {url}")
+        log.info("[NAV] Navigating to %s → %s", label, url)
         self.driver.get(url)
 
         if verify:
@@ -19,18 +20,26 @@ class Navigator:
 
     def verify(self, url: str = None, check_locator=None, timeout: int = 15):
         """Verify page has loaded (readyState, URL match, optional element)."""
-        WebDriverWait(self.driver, timeout).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
-        )
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            log.warning("[NAV] Page did not finish loading within %ss", timeout)
+            return {"status": "failed", "reason": "load_timeout"}
 
         if url and not self.driver.current_url.startswith(url):
-            log.warning(f"[NAV] Expected {url}, got {self.driver.current_url}")
+            log.warning("[NAV] Expected %s, got %s", url, self.driver.current_url)
             return {"status": "failed", "reason": "url_mismatch"}
 
         if check_locator:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(check_locator)
-            )
-            log.info(f"[NAV] Verified element {check_locator}")
+            try:
+                WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_element_located(check_locator)
+                )
+            except TimeoutException:
+                log.warning("[NAV] Element %s not found within %ss", check_locator, timeout)
+                return {"status": "failed", "reason": "element_missing"}
+            log.info("[NAV] Verified element %s", check_locator)
 
         return {"status": "ok"}
@@ -1,3 +1,4 @@
+import logging
 import time
 
 from selenium.webdriver.common.by import By
@@ -15,11 +16,11 @@ from compass_automation.flows.mileage_flows import complete_mileage_dialog
 def handle_existing_complaint(driver, mva: str) -> dict:
     """Select an existing complaint tile and advance."""
     if click_element(driver, (By.XPATH, "//button[normalize-space()='Next']")):
-        log.info(f"[COMPLAINT] {mva} - Next clicked after selecting existing complaint")
+        log.info("[COMPLAINT] %s - Next clicked after selecting existing complaint", mva)
         return {"status": "ok"}
 
     else:
-        log.debug(f"[WORKITEM][WARN] {mva} - could not advance with existing complaint")
+        log.debug("[WORKITEM][WARN] %s - could not advance with existing complaint", mva)
         return {"status": "failed", "reason": "existing_complaint_next"}
 
 def handle_new_complaint(driver, mva: str) -> dict:
@@ -29,39 +30,39 @@ def handle_new_complaint(driver, mva: str) -> dict:
     or click_element(driver, (By.XPATH, "//button[normalize-space()='Create New Complaint']"))
     ):
 
-        log.warning(f"[WORKITEM][WARN] {mva} - Add/Create New Complaint not found")
+        log.warning("[WORKITEM][WARN] %s - Add/Create New Complaint not found", mva)
         return {"status": "failed", "reason": "new_complaint_entry"}
 
-    log.info(f"[WORKITEM] {mva} - Adding new complaint")
+    log.info("[WORKITEM] %s - Adding new complaint", mva)
     time.sleep(2)
 
     # Drivability -> Yes
-    log.info(f"[DRIVABLE] {mva} - answering drivability question: Yes")
+    log.info("[DRIVABLE] %s - answering drivability question: Yes", mva)
     if not click_element(driver, (By.XPATH, "//button[normalize-space()='Yes']")):
-        log.warning(f"[WORKITEM][WARN] {mva} - Drivable=Yes button not found")
+        log.warning("[WORKITEM][WARN] %s - Drivable=Yes button not found", mva)
         return {"status": "failed", "reason": "drivable_yes"}
-    log.info(f"[COMPLAINT] {mva} - Drivable=Yes")
+    log.info("[COMPLAINT] %s - Drivable=Yes", mva)
 
 
     # Complaint Type -> PM
     if not click_element(driver, (By.XPATH, "//button[normalize-space()='PM']")):
-        log.warning(f"[WORKITEM][WARN] {mva} - Complaint type PM not found")
+        log.warning("[WORKITEM][WARN] %s - Complaint type PM not found", mva)
         return {"status": "failed", "reason": "complaint_pm"}
-    log.info(f"[COMPLAINT] {mva} - PM complaint selected")
+    log.info("[COMPLAINT] %s - PM complaint selected", mva)
 
 
     # Submit
     if not click_element(driver, (By.XPATH, "//button[normalize-space()='Submit Complaint']")):
 
-        log.warning(f"[WORKITEM][WARN] {mva} - Submit Complaint not found")
+        log.warning("[WORKITEM][WARN] %s - Submit Complaint not found", mva)
         return {"status": "failed", "reason": "submit_complaint"}
-    log.info(f"[COMPLAINT] {mva} - Submit Complaint clicked")
+    log.info("[COMPLAINT] %s - Submit Complaint clicked", mva)
 
     # Next -> proceed to Mileage
     if not click_element(driver, (By.XPATH, "//button[normalize-space()='Next']")):
-        log.warning(f"[WORKITEM][WARN] {mva} - could not advance after new complaint")
+        log.warning("[WORKITEM][WARN] %s - could not advance after new complaint", mva)
         return {"status": "failed", "reason": "new_complaint_next"}
-    log.info(f"[COMPLAINT] {mva} - Next clicked after new complaint")
+    log.info("[COMPLAINT] %s - Next clicked after new complaint", mva)
 
     return {"status": "ok"}
 
@@ -76,6 +77,14 @@ def find_dialog(driver):
     locator = (By.CSS_SELECTOR, "div.bp6-dialog, div[class*='dialog']")
     return find_element(driver, locator)
 
+def _tile_texts(driver, tiles) -> list:
+    """Return the trimmed innerText of every tile in one execute_script call."""
+    if not tiles:
+        return []
+    return driver.execute_script(
+        "return arguments[0].map(e => (e.innerText || '').trim());", tiles
+    )
+
 def detect_existing_complaints(driver, mva: str):
     """Detect complaint tiles containing 'PM' in their text."""
     try:
@@ -83,17 +92,19 @@ def detect_existing_complaints(driver, mva: str):
         tiles = driver.find_elements(
             By.XPATH, "//div[contains(@class,'fleet-operations-pwa__complaintItem__')]"
         )
-        log.debug(f"[COMPLAINT] {mva} — found {len(tiles)} total complaint tile(s)")
-
-        valid_tiles = [t for t in tiles if "PM" in t.text.strip()]
-        log.debug(
-            f"[COMPLAINT] {mva} — filtered {len(valid_tiles)} PM-type complaint(s): "
-            f"{[t.text for t in valid_tiles]}"
-        )
+        log.debug("[COMPLAINT] %s — found %s total complaint tile(s)", mva, len(tiles))
+
+        texts = _tile_texts(driver, tiles)
+        valid_tiles = [t for t, text in zip(tiles, texts) if "PM" in text]
+        if log.isEnabledFor(logging.DEBUG):  # skip building the label list otherwise
+            log.debug(
+                "[COMPLAINT] %s — filtered %s PM-type complaint(s): %s",
+                mva, len(valid_tiles), [text for text in texts if "PM" in text],
+            )
 
         return valid_tiles
     except Exception as e:
-        log.error(f"[COMPLAINT][ERROR] {mva} — complaint detection failed → {e}")
+        log.error("[COMPLAINT][ERROR] %s — complaint detection failed → %s", mva, e)
         return []
 
 def find_pm_tiles(driver, mva: str):
@@ -108,10 +119,10 @@ def find_pm_tiles(driver, mva: str):
                 )
             )
         )
-        log.info(f"[COMPLAINT] {mva} — found {len(tiles)} PM/Hard Hold PM complaint tile(s)")
+        log.info("[COMPLAINT] %s — found %s PM/Hard Hold PM complaint tile(s)", mva, len(tiles))
         return tiles
     except Exception as e:
-        log.info(f"[COMPLAINT] {mva} — no PM complaint tiles found ({e})")
+        log.info("[COMPLAINT] %s — no PM complaint tiles found (%s)", mva, e)
         return []
 
 # Extracted methods for associate_existing_complaint refactoring
@@ -127,19 +138,23 @@ def _find_pm_complaint_tiles(driver, mva: str):
         time.sleep(3)  # wait for tiles to load
         
         if not tiles:
-            log.info(f"[COMPLAINT][EXISTING] {mva} - no complaint tiles found")
+            log.info("[COMPLAINT][EXISTING] %s - no complaint tiles found", mva)
             return None, None, {"status": "skipped_no_complaint", "mva": mva}
 
         # Filter PM complaints only
-        pm_tiles = [t for t in tiles if any(label in t.text for label in ["PM", "PM Hard Hold - PM"])]
+        texts = _tile_texts(driver, tiles)
+        pm_tiles = [
+            t for t, text in zip(tiles, texts)
+            if any(label in text for label in ["PM", "PM Hard Hold - PM"])
+        ]
         if not pm_tiles:
-            log.info(f"[COMPLAINT][EXISTING] {mva} - no PM complaints found")
+            log.info("[COMPLAINT][EXISTING] %s - no PM complaints found", mva)
             return tiles, None, {"status": "skipped_no_complaint", "mva": mva}
 
         return tiles, pm_tiles, None
         
     except Exception as e:
-        log.warning(f"[COMPLAINT][WARN] {mva} - failed to find complaint tiles → {e}")
+        log.warning("[COMPLAINT][WARN] %s - failed to find complaint tiles → %s", mva, e)
         return None, None, {"status": "failed", "reason": "tile_search", "mva": mva}
 
 def _select_complaint_tile(tile, mva: str):
@@ -149,10 +164,10 @@ def _select_complaint_tile(tile, mva: str):
     """
     try:
         tile.click()
-        log.info(f"[COMPLAINT][ASSOCIATED] {mva} - complaint '{tile.text.strip()}' selected")
+        log.info("[COMPLAINT][ASSOCIATED] %s - complaint '%s' selected", mva, tile.text.strip())
         return None  # Success
     except Exception as e:
-        log.warning(f"[COMPLAINT][WARN] {mva} - failed to click complaint tile → {e}")
+        log.warning("[COMPLAINT][WARN] %s - failed to click complaint tile → %s", mva, e)
         return {"status": "failed", "reason": "tile_click", "mva": mva}
 
 def _execute_complaint_dialog_step(driver, mva: str):
@@ -179,7 +194,7 @@ def _execute_opcode_dialog_step(driver, mva: str):
 def _create_failure_result(reason: str, mva: str, exception_msg: str = None):
     """Create standardized failure result dictionary."""
     if exception_msg:
-        log.warning(f"[COMPLAINT][WARN] {mva} - complaint association failed → {exception_msg}")
+        log.warning("[COMPLAINT][WARN] %s - complaint association failed → %s", mva, exception_msg)
     return {"status": "failed", "reason": reason, "mva": mva}
 
 def associate_existing_complaint(driver, mva: str) -> dict:
@@ -219,7 +234,7 @@ def associate_existing_complaint(driver, mva: str) -> dict:
 
 def create_new_complaint(driver, mva: str) -> dict:
     """Create a new complaint when no suitable PM complaint exists."""
-    log.info(f"[COMPLAINT][NEW] {mva} - creating new complaint")
+    log.info("[COMPLAINT][NEW] %s - creating new complaint", mva)
 
     try:
         # 1. Click Add New Complaint (or Create New Complaint)
@@ -228,43 +243,41 @@ def create_new_complaint(driver, mva: str) -> dict:
             or click_element(driver, (By.XPATH, "//button[normalize-space()='Create New Complaint']"))
         ):
 
-            log.warning(
-                "[COMPLAINT][NEW][WARN] {mva} - could not click Add/Create New Complaint"
-            )
+            log.warning("[COMPLAINT][NEW][WARN] %s - could not click Add/Create New Complaint", mva)
             return {"status": "failed", "reason": "add_btn"}
-        log.info(f"[COMPLAINT][NEW] {mva} - Add/Create New Complaint clicked")
+        log.info("[COMPLAINT][NEW] %s - Add/Create New Complaint clicked", mva)
         time.sleep(2)
 
         # 2. Handle Drivability (Yes/No). Simplest case -> always Yes
         if not click_element(driver, (By.XPATH, "//button[normalize-space()='Yes']")):
             log.warning(
-                f"[COMPLAINT][NEW][WARN] {mva} - could not click Yes in Drivability step"
+                "[COMPLAINT][NEW][WARN] %s - could not click Yes in Drivability step", mva
             )
             return {"status": "failed", "reason": "drivability"}
-        log.info(f"[COMPLAINT][NEW] {mva} - Drivability Yes clicked")
+        log.info("[COMPLAINT][NEW] %s - Drivability Yes clicked", mva)
         time.sleep(1)
 
         # 3) Complaint Type = PM (auto-advances, no Next button here)
         if click_element(driver, (By.XPATH, "//button[normalize-space()='PM']")):
-            log.info(f"[COMPLAINT] {mva} - Complaint type 'PM' selected")
+            log.info("[COMPLAINT] %s - Complaint type 'PM' selected", mva)
             time.sleep(2)  # allow auto-advance to Additional Info screen
         else:
-            log.warning(f"[COMPLAINT][WARN] {mva} - Complaint type 'PM' not found")
+            log.warning("[COMPLAINT][WARN] %s - Complaint type 'PM' not found", mva)
             return {"status": "failed", "reason": "complaint_type", "mva": mva}
 
         # 4) Additional Info screen -> Submit
         if click_element(driver, (By.XPATH, "//button[normalize-space()='Submit Complaint']")):
-            log.info(f"[COMPLAINT] {mva} - Additional Info submitted")
+            log.info("[COMPLAINT] %s - Additional Info submitted", mva)
             time.sleep(2)
         else:
-            log.warning(f"[COMPLAINT][WARN] {mva} - could not submit Additional Info")
+            log.warning("[COMPLAINT][WARN] %s - could not submit Additional Info", mva)
             return {"status": "failed", "reason": "submit_info", "mva": mva}
 
         return {"status": "created"}
 
 
     except Exception as e:
-        log.error(f"[COMPLAINT][NEW][ERROR] {mva} - creation failed -> {e}")
+        log.error("[COMPLAINT][NEW][ERROR] %s - creation failed -> %s", mva, e)
         return {"status": "failed", "reason": "exception"}
 
 def click_next_in_dialog(driver, timeout: int = 10) -> bool:
@@ -278,7 +291,7 @@ def click_next_in_dialog(driver, timeout: int = 10) -> bool:
         from selenium.webdriver.support import expected_conditions as EC
 
         locator = (By.XPATH, "//button[normalize-space()='Next']")
-        log.debug(f"[CLICK] attempting to click {locator} (dialog Next)")
+        log.debug("[CLICK] attempting to click %s (dialog Next)", locator)
 
         btn = WebDriverWait(driver, timeout).until(
             EC.element_to_be_clickable(locator)
@@ -289,5 +302,5 @@ def click_next_in_dialog(driver, timeout: int = 10) -> bool:
         return True
 
     except Exception as e:
-        log.warning(f"[DIALOG][WARN] could not click Next button → {e}")
+        log.warning("[DIALOG][WARN] could not click Next button → %s", e)
         return False
@@ -1,13 +1,30 @@
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 
 from compass_automation.utils.logger import log
-from compass_automation.utils.ui_helpers import find_element, find_elements
+from compass_automation.utils.ui_helpers import find_element
+
+_DIALOG_LOC = (By.CSS_SELECTOR, "div.bp6-dialog, div[class*='dialog']")
+
+# Poll in-page (every 100 ms) for 'Next' buttons and resolve once with the matches,
+# instead of one find_elements WebDriver command per poll. arguments[0]: timeout in ms.
+_WAIT_NEXT_BTNS_JS = """
+const timeoutMs = arguments[0], done = arguments[arguments.length - 1];
+const norm = el => (el.textContent || '').replace(/\\s+/g, ' ').trim();
+const query = () => Array.from(document.querySelectorAll('button')).filter(b =>
+    norm(b) === 'Next' || Array.from(b.querySelectorAll('span')).some(s => norm(s) === 'Next'));
+const deadline = Date.now() + timeoutMs;
+(function poll() {
+    const found = query();
+    if (found.length || Date.now() >= deadline) return done(found);
+    setTimeout(poll, 100);
+})();
+"""
 
 
 def find_dialog(driver):
     """Return the main dialog container element."""
-    locator = (By.CSS_SELECTOR, "div.bp6-dialog, div[class*='dialog']")
-    return find_element(driver, locator)
+    return find_element(driver, _DIALOG_LOC)
 
 
 def dbg_dialog(driver):
@@ -15,13 +32,15 @@ def dbg_dialog(driver):
     try:
         dlg = find_dialog(driver)
     except Exception:
-        dlg = driver
-    btns = dlg.find_elements(
-        By.XPATH,
-        ".//button//*[self::span or self::div or self::p or self::strong]|.//button",
+        dlg = None
+    # One round-trip for all labels instead of one .text call per button
+    labels = driver.execute_script(
+        "const root = arguments[0] || document;"
+        "return Array.from(root.querySelectorAll('button'))"
+        ".map(b => (b.innerText || '').trim()).filter(Boolean).slice(0, 12);",
+        dlg,
     )
-    labels = [b.text.strip() for b in btns if b.text.strip()]
-    log.debug(f" dialog buttons -> {labels[:12]}")
+    log.debug(" dialog buttons -> %s", labels)
     try:
         driver.save_screenshot("debug_drivable.png")
         print("[DBG] screenshot -> debug_drivable.png")
@@ -29,28 +48,10 @@ def dbg_dialog(driver):
         pass
 
 
-def find_next_buttons(driver):
+def find_next_buttons(driver, timeout: int = 8):
     """Return all 'Next' buttons currently visible in dialogs."""
-    locator = (
-        By.XPATH,
-        "//button[.//span[normalize-space()='Next'] or normalize-space()='Next']",
-    )
-    return find_elements(driver, locator, timeout=8)
-
+    buttons = driver.execute_async_script(_WAIT_NEXT_BTNS_JS, timeout * 1000)
+    if not buttons:
+        raise TimeoutException(f"No 'Next' buttons found within {timeout}s")
+    return buttons
 
-def _dbg_dialog(driver):
-    try:
-        dlg = find_dialog(driver)
-    except Exception:
-        dlg = driver
-    btns = dlg.find_elements(
-        By.XPATH,
-        ".//button//*[self::span or self::div or self::p or self::strong]|.//button",
-    )
-    labels = [b.text.strip() for b in btns if b.text.strip()]
-    log.debug(f" dialog buttons -> {labels[:12]}")
-    try:
-        driver.save_screenshot("debug_drivable.png")
-        print("[DBG] screenshot -> debug_drivable.png")
-    except Exception:
-        pass
@@ -17,31 +17,31 @@ def finalize_workitem(driver, mva: str) -> dict:
     try:
         # Step 1: Click Create Work Item
         if not click_element(driver, (By.XPATH, "//button[normalize-space()='Create Work Item']")):
-            log.warning(f"[WORKITEM][WARN] {mva} - 'Create Work Item' button not found")
+            log.warning("[WORKITEM][WARN] %s - 'Create Work Item' button not found", mva)
             return {"status": "failed", "reason": "create_btn", "mva": mva}
 
-        log.info(f"[WORKITEM] {mva} - 'Create Work Item' clicked")
+        log.info("[WORKITEM] %s - 'Create Work Item' clicked", mva)
         time.sleep(2)  # allow UI to update
 
         # Step 2: Verify Work Item exists
         tiles = driver.find_elements(By.XPATH, "//div[contains(@class,'scan-record-header')]")
         if not tiles:
-            log.warning(f"[WORKITEM][WARN] {mva} - no Work Item tiles found after creation")
+            log.warning("[WORKITEM][WARN] %s - no Work Item tiles found after creation", mva)
             return {"status": "failed", "reason": "no_tiles", "mva": mva}
 
-        log.info(f"[WORKITEM] {mva} - Work Item created successfully ({len(tiles)} total)")
+        log.info("[WORKITEM] %s - Work Item created successfully (%s total)", mva, len(tiles))
 
         # Step 3: Complete the Work Item (lazy import to avoid circular import)
         from compass_automation.flows.work_item_flow import complete_pm_workitem
         res = complete_pm_workitem(driver, mva)
         if res.get("status") != "ok":
-            log.warning(f"[WORKITEM][WARN] {mva} - could not complete Work Item")
+            log.warning("[WORKITEM][WARN] %s - could not complete Work Item", mva)
             return {"status": "failed", "reason": "complete", "mva": mva}
 
-        log.info(f"[WORKITEM] {mva} - Work Item finalized and closed")
+        log.info("[WORKITEM] %s - Work Item finalized and closed", mva)
         return {"status": "closed", "mva": mva}
 
     except Exception as e:
-        log.error(f"[WORKITEM][ERROR] {mva} - finalize_workitem exception → {e}")
+        log.error("[WORKITEM][ERROR] %s - finalize_workitem exception → %s", mva, e)
         navigate_back_to_home(driver)
         return {"status": "failed", "reason": "exception", "mva": mva}
@@ -1,55 +1,73 @@
-import time
-from compass_automation.utils.logger import log
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from compass_automation.utils.ui_helpers import click_element, send_text
+
+from compass_automation.utils.logger import log
+from compass_automation.utils.ui_helpers import click_element, find_element
+
+_NEXT_BTN_LOC = (By.XPATH, "//button[normalize-space()='Next']")
+_MILEAGE_INPUT_LOC = (By.XPATH, "//input[contains(@class,'mileage-input')]")
+# Next inside the dialog that holds the mileage input, not the first Next on the page
+_MILEAGE_NEXT_LOC = (
+    By.XPATH,
+    "//input[contains(@class,'mileage-input')]/ancestor::div[contains(@class,'bp6-dialog')][1]"
+    "//button[normalize-space()='Next']",
+)
+
+# Set a React-controlled input via the native setter and fire input/change.
+# Returns true if the value stuck.
+_SET_MILEAGE_JS = """
+const inp = arguments[0], value = arguments[1];
+const setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+setter.call(inp, value);
+inp.dispatchEvent(new Event('input', {bubbles: true}));
+inp.dispatchEvent(new Event('change', {bubbles: true}));
+return inp.value === value;
+"""
 
 
 def complete_mileage_dialog(driver, mva: str) -> dict:
     """Click Next on the mileage dialog."""
     try:
-        if click_element(driver, (By.XPATH, "//button[normalize-space()='Next']")):
-            log.info(f"[MILEAGE] {mva} - Next clicked on mileage dialog")
+        if click_element(driver, _NEXT_BTN_LOC):
+            log.info("[MILEAGE] %s - Next clicked on mileage dialog", mva)
             return {"status": "ok"}
         else:
-            log.info(f"[MILEAGE][FAIL] {mva} - Next button not found")
+            log.info("[MILEAGE][FAIL] %s - Next button not found", mva)
             return {"status": "failed", "reason": "next_btn"}
     except Exception as e:
-        log.error(f"[MILEAGE][ERROR] {mva} - exception -> {e}")
+        log.error("[MILEAGE][ERROR] %s - exception -> %s", mva, e)
         return {"status": "failed", "reason": "exception"}
 
 
 def enter_mileage(driver, mva: str, mileage: int) -> dict:
     """Enter the mileage value into the mileage input field."""
-    log.info(f"[MILEAGE] {mva} - entering mileage: {mileage}")
+    log.info("[MILEAGE] %s - entering mileage: %s", mva, mileage)
 
     try:
-        # 1. Find the mileage input field
-        # input_field = driver.find_element(By.XPATH, "//input[contains(@class,'mileage-input')]")
-        # input_field.clear()
-        # input_field.send_keys(str(mileage))
-
-        # 1. Send mileage directly into the input field
-        if not send_text(
-            driver,
-            (By.XPATH, "//input[contains(@class,'mileage-input')]"),
-            str(mileage),
-        ):
+        # 1. Wait for the mileage input field
+        try:
+            input_field = find_element(driver, _MILEAGE_INPUT_LOC)
+        except TimeoutException:
+            log.warning("[MILEAGE][FAIL] %s - mileage input not found", mva)
             return {"status": "failed", "reason": "mileage_input"}
 
-        log.info(f"[MILEAGE] {mva} - mileage entered: {mileage}")
-        time.sleep(1)
+        # 2. Set the value in one round-trip
+        if not driver.execute_script(_SET_MILEAGE_JS, input_field, str(mileage)):
+            log.warning("[MILEAGE][FAIL] %s - mileage value did not stick", mva)
+            return {"status": "failed", "reason": "mileage_input"}
 
-        # 2. Click Next
-        if click_element(driver, (By.XPATH, "//button[normalize-space()='Next']")):
-            log.info(f"[MILEAGE] {mva} - Next clicked after entering mileage")
+        log.info("[MILEAGE] %s - mileage entered: %s", mva, mileage)
+        # 3. Click Next once React has re-rendered it enabled (click_element waits
+        # for clickable, which covers the old 1s settle)
+        if click_element(driver, _MILEAGE_NEXT_LOC, desc="mileage Next"):
+            log.info("[MILEAGE] %s - Next clicked after entering mileage", mva)
             return {"status": "ok"}
 
-        else:
-            log.info(
-                "[MILEAGE][FAIL] {mva} - Next button not found after entering mileage"
-            )
-            return {"status": "failed", "reason": "next_btn"}
+        log.info(
+            "[MILEAGE][FAIL] %s - Next button not found after entering mileage", mva
+        )
+        return {"status": "failed", "reason": "next_btn"}
 
     except Exception as e:
-        log.error(f"[MILEAGE][ERROR] {mva} - exception -> {e}")
+        log.error("[MILEAGE][ERROR] %s - exception -> %s", mva, e)
         return {"status": "failed", "reason": "exception"}
@@ -1,37 +1,45 @@
-import time
-
 from selenium.webdriver.common.by import By
 
 from compass_automation.utils.logger import log
-from compass_automation.utils.ui_helpers import find_element
+from compass_automation.utils.ui_helpers import find_element, xpath_literal
+
+# Opcode tiles whose opCodeText equals arguments[0] (normalize-space semantics)
+_OPCODE_TILES_JS = r"""
+const norm = el => (el.textContent || '').replace(/\s+/g, ' ').trim();
+const text = arguments[0];
+return Array.from(document.querySelectorAll("div[class*='opCodeItem']")).filter(tile =>
+    Array.from(tile.querySelectorAll("div[class*='opCodeText']")).some(t => norm(t) === text));
+"""
+# Scroll into view, then resolve after two animation frames (layout + paint done)
+_SCROLL_SETTLE_JS = """
+const el = arguments[0], done = arguments[arguments.length - 1];
+el.scrollIntoView({block: 'center'});
+requestAnimationFrame(() => requestAnimationFrame(() => done()));
+"""
+_OPCODE_TILE_TPL = (
+    "//div[contains(@class,'opCodeItem')]"
+    "[.//div[contains(@class,'opCodeText')][normalize-space()={}]]"
+)
 
 
 def select_opcode(driver, mva: str, code_text: str = "PM Gas") -> dict:
     """Select an opcode by visible text from the opcode dialog."""
-    xpath = (
-        "//div[contains(@class,'opCodeItem')]"
-        f"[.//div[contains(@class,'opCodeText')][normalize-space()='{code_text}']]"
-    )
-    log.debug(f" searching for opcode tile -> {xpath}")
+    log.debug(" searching for opcode tile -> %r", code_text)
 
-    tiles = driver.find_elements(By.XPATH, xpath)
+    tiles = driver.execute_script(_OPCODE_TILES_JS, code_text) or []
     if not tiles:
-        log.warning(f"[WORKITEM][WARN] {mva} - Opcode '{code_text}' not found")
+        log.warning("[WORKITEM][WARN] %s - Opcode '%s' not found", mva, code_text)
         return {"status": "failed", "reason": "opcode_not_found"}
     else:
-        log.debug(f" found {len(tiles)} matching opcode tiles")
+        log.debug(" found %s matching opcode tiles", len(tiles))
 
     tile = tiles[0]
-    driver.execute_script("arguments[0].scrollIntoView({block:'center'});", tile)
-    time.sleep(1)
+    driver.execute_async_script(_SCROLL_SETTLE_JS, tile)
     tile.click()
-    log.info(f"[COMPLAINT] {mva} - Opcode '{code_text}' selected")
+    log.info("[COMPLAINT] %s - Opcode '%s' selected", mva, code_text)
     return {"status": "ok"}
 
 
 def find_opcode_tile(driver, name: str):
-    locator = (
-        By.XPATH,
-        f"//div[contains(@class,'opCodeItem')][.//div[contains(@class,'opCodeText')][normalize-space()='{name}']]",
-    )
+    locator = (By.XPATH, _OPCODE_TILE_TPL.format(xpath_literal(name)))
     return find_element(driver, locator)
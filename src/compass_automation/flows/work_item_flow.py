@@ -1,32 +1,111 @@
 """Flows for creating, processing, and handling Compass Work Items."""
-import time
+from dataclasses import dataclass, field
+
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from compass_automation.flows.complaints_flows import associate_existing_complaint
 from compass_automation.flows.finalize_flow import finalize_workitem
 from compass_automation.utils.logger import log
-from compass_automation.utils.ui_helpers import click_element, safe_wait
+from compass_automation.utils.ui_helpers import click_element, navigate_back_to_home, safe_wait, settle
+
+_WORKITEM_HEADER_LOC = (By.XPATH, "//div[contains(@class,'scan-record-header')]")
+_ADD_WORKITEM_BTN_LOC = (By.XPATH, "//button[normalize-space()='Add Work Item']")
+_DIALOG_LOC = (By.CSS_SELECTOR, "div.bp6-dialog")
+_COMPLAINT_TILE_LOC = (By.XPATH, "//div[contains(@class,'fleet-operations-pwa__complaintItem__')]")
+# [dialog, textarea, 'Complete Work Item' button] once all are rendered, else null
+_CORRECTION_DIALOG_JS = """
+const dlg = Array.from(document.querySelectorAll('div.bp6-dialog')).find(d => d.getClientRects().length > 0);
+if (!dlg) return null;
+const ta = dlg.querySelector('textarea.bp6-text-area');
+const btn = Array.from(dlg.querySelectorAll('button'))
+    .find(b => b.textContent.replace(/\\s+/g, ' ').trim() === 'Complete Work Item');
+return (ta && btn) ? [dlg, ta, btn] : null;
+"""
+# Click 'Mark Complete' (class selector first, then exact text) in one command; true if clicked
+_CLICK_MARK_COMPLETE_JS = """
+const el = document.querySelector('button.fleet-operations-pwa__mark-complete-button__spuz8c')
+    || Array.from(document.querySelectorAll('button'))
+        .find(b => b.textContent.replace(/\\s+/g, ' ').trim() === 'Mark Complete');
+if (el && !el.disabled) { el.click(); return true; }
+return false;
+"""
+
+# In-page filter for Open PM work item headers; one WebDriver command instead of a
+# driver-side XPath walk. arguments[0]: exact titles to accept, or null for "contains PM".
+# Returns parallel arrays so titles/statuses need no further round-trips.
+_OPEN_PM_HEADERS_JS = r"""
+const norm = el => (el.textContent || '').replace(/\s+/g, ' ').trim();
+const titles = arguments[0];
+const out = {elements: [], titles: [], statuses: []};
+for (const h of document.querySelectorAll("div[class*='scan-record-header']")) {
+    const title = Array.from(h.querySelectorAll("div[class*='scan-record-header-title']"))
+        .map(norm).find(t => titles ? titles.includes(t) : t.includes('PM'));
+    const status = Array.from(h.querySelectorAll("div[class*='scan-record-header-title-right']"))
+        .map(norm).find(r => r === 'Open');
+    if (title !== undefined && status !== undefined) {
+        out.elements.push(h); out.titles.push(title); out.statuses.push(status);
+    }
+}
+return out;
+"""
+# Number of PM work item headers reporting 'Complete'; it goes up once the backend has
+# recorded a completion. Same state/type test as ui_helpers.has_complete_of_type
+_PM_COMPLETE_JS = r"""
+const norm = el => (el.textContent || '').replace(/\s+/g, ' ').trim();
+return Array.from(document.querySelectorAll("div[class*='scan-record-header']")).filter(h =>
+    Array.from(h.querySelectorAll("div[class*='scan-record-header-title']")).some(t => norm(t).includes('PM'))
+    && Array.from(h.querySelectorAll("div[class*='scan-record-header-title-right']")).some(r => norm(r) === 'Complete')).length;
+"""
+
+
+@dataclass(slots=True)
+class WorkItemBatch:
+    """Open PM work item headers with their text scraped up front (parallel lists)."""
+    elements: list = field(default_factory=list)
+    titles: list[str] = field(default_factory=list)
+    statuses: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def __bool__(self) -> bool:
+        return bool(self.elements)
+
+
+def _collect_open_pm(driver, titles=None) -> WorkItemBatch:
+    """Run the header filter once and wrap the result in a WorkItemBatch."""
+    raw = driver.execute_script(_OPEN_PM_HEADERS_JS, titles) or {}
+    return WorkItemBatch(
+        elements=raw.get("elements", []),
+        titles=raw.get("titles", []),
+        statuses=raw.get("statuses", []),
+    )
 
 def get_work_items(driver, mva: str):
-    """Collect all open PM work items for the given MVA."""
-    log.info(f"[WORKITEM] {mva} - pausing to let Work Items render...")
-    time.sleep(9)  # wait for UI to render
+    """Collect all open PM work items for the given MVA as a WorkItemBatch."""
+    log.info("[WORKITEM] %s - waiting for Work Items to render...", mva)
     try:
-        tiles = driver.find_elements(
-            By.XPATH,
-            "//div[contains(@class,'scan-record-header') "
-            "and .//div[contains(@class,'scan-record-header-title')][contains(normalize-space(),'PM')] "
-            "and .//div[contains(@class,'scan-record-header-title-right__')][normalize-space()='Open']]"
+        # Headers, or the Add Work Item button an empty list renders with
+        WebDriverWait(driver, 15).until(
+            lambda d: d.find_elements(*_WORKITEM_HEADER_LOC) or d.find_elements(*_ADD_WORKITEM_BTN_LOC)
         )
-        log.info(f"[WORKITEMS] {mva} - collected {len(tiles)} open PM item(s)")
-        for t in tiles:
-            log.debug(f"[DBG] {mva} - tile text = {t.text!r}")
-        return tiles
-    except NoSuchElementException as e:
-        log.warning(f"[WORKITEM][WARN] {mva} - could not collect work items -> {e}")
-        return []
+    except TimeoutException:
+        pass
+    # The button can paint just ahead of the headers; give them a brief moment
+    if not settle(driver, EC.presence_of_element_located(_WORKITEM_HEADER_LOC), max_wait=1):
+        log.info("[WORKITEMS] %s - no work item tiles rendered", mva)
+        return WorkItemBatch()
+    try:
+        batch = _collect_open_pm(driver)
+        log.info("[WORKITEMS] %s - collected %s open PM item(s)", mva, len(batch))
+        for title, status in zip(batch.titles, batch.statuses):
+            log.debug("[DBG] %s - tile = %r (%s)", mva, title, status)
+        return batch
+    except WebDriverException as e:
+        log.warning("[WORKITEM][WARN] %s - could not collect work items -> %s", mva, e)
+        return WorkItemBatch()
 
 
 
@@ -34,39 +113,43 @@ def get_work_items(driver, mva: str):
 
 def create_new_workitem(driver, mva: str):
     """Create a new Work Item for the given MVA."""
-    log.info(f"[WORKITEM] {mva} - starting CREATE NEW WORK ITEM workflow")
+    log.info("[WORKITEM] %s - starting CREATE NEW WORK ITEM workflow", mva)
 
     # Step 1: Click Add Work Item
     try:
-        time.sleep(5)  # wait for button to appear
-        if not click_element(driver, (By.XPATH, "//button[normalize-space()='Add Work Item']")):
-            log.warning(f"[WORKITEM][WARN] {mva} - add_btn not found")
+        if not click_element(driver, _ADD_WORKITEM_BTN_LOC, timeout=10):
+            log.warning("[WORKITEM][WARN] %s - add_btn not found", mva)
             return {"status": "failed", "reason": "add_btn", "mva": mva}
-        log.info(f"[WORKITEM] {mva} - Add Work Item clicked")
-        time.sleep(5)
-
-    except NoSuchElementException:
-        log.warning(f"[WORKITEM][WARN] {mva} - add_btn failed -> {e}")
+        log.info("[WORKITEM] %s - Add Work Item clicked", mva)
+    except NoSuchElementException as e:
+        log.warning("[WORKITEM][WARN] %s - add_btn failed -> %s", mva, e)
         return {"status": "failed", "reason": "add_btn", "mva": mva}
 
-    # Step 2: Complaint handling
+    # Step 2: Complaint handling, once its tiles (or a dialog) have rendered; on a
+    # timeout the complaint lookup itself reports that nothing is there
+    try:
+        WebDriverWait(driver, 10).until(
+            lambda d: d.find_elements(*_COMPLAINT_TILE_LOC) or d.find_elements(*_DIALOG_LOC)
+        )
+    except TimeoutException:
+        log.debug("[WORKITEM] %s - no complaint tiles or dialog after Add Work Item", mva)
     try:
         res = associate_existing_complaint(driver, mva)
         if res["status"] == "associated":
             log.info(
-                "[COMPLAINT][ASSOCIATED] {mva} - existing PM complaint linked to Work Item"
+                "[COMPLAINT][ASSOCIATED] %s - existing PM complaint linked to Work Item", mva
             )
         else:
             log.info(
-                "[WORKITEM][SKIP] {mva} - no existing PM complaint, navigating back"
+                "[WORKITEM][SKIP] %s - no existing PM complaint, navigating back", mva
             )
             return {"status": "skipped_no_complaint", "mva": mva}
     except NoSuchElementException as e:
-        log.warning(f"[WORKITEM][WARN] {mva} - complaint handling failed -> {e}")
+        log.warning("[WORKITEM][WARN] %s - complaint handling failed -> %s", mva, e)
         return {"status": "failed", "reason": "complaint_handling", "mva": mva}
 
     # Step 3: Finalize Work Item (call will be injected here in refactor later)
-    log.warning(f"[WORKITEM][WARN] {mva} - finalize step skipped (refactor placeholder)")
+    log.warning("[WORKITEM][WARN] %s - finalize step skipped (refactor placeholder)", mva)
     return {"status": "created", "mva": mva}
 
 
@@ -78,39 +161,34 @@ def handle_pm_workitems(driver, mva: str) -> dict:
          - Try to associate an existing complaint.
          - If none, skip and return control to the test loop.
     """
-    log.info(f"[WORKITEM] {mva} — handling PM work items")
+    log.info("[WORKITEM] %s — handling PM work items", mva)
 
     # Step 1: check for open PM Work Items
     items = get_work_items(driver, mva)
     if items:
-        log.info(f"[WORKITEM] {mva} - open PM Work Item found, completing it")
-        from compass_automation.flows.work_item_flow import complete_pm_workitem
+        log.info("[WORKITEM] %s - open PM Work Item found, completing it", mva)
         return complete_pm_workitem(driver, mva)
 
     # Step 2: no open WI → start a new one
-    from selenium.webdriver.common.by import By
-    if click_element(driver, (By.XPATH, "//button[normalize-space()='Add Work Item']"),
+    if click_element(driver, _ADD_WORKITEM_BTN_LOC,
                      desc="Add Work Item", timeout=8):
-        log.info(f"[WORKITEM] {mva} - Add Work Item clicked")
+        log.info("[WORKITEM] %s - Add Work Item clicked", mva)
 
         # Required Action: immediately try to associate existing complaints
-        from compass_automation.flows.complaints_flows import associate_existing_complaint
         res = associate_existing_complaint(driver, mva)
 
         if res.get("status") == "associated":
-            from compass_automation.flows.finalize_flow import finalize_workitem
             return finalize_workitem(driver, mva)
 
         elif res.get("status") == "skipped_no_complaint":
-            log.info(f"[WORKITEM] {mva} — navigating back home after skip")
-            from compass_automation.utils.ui_helpers import navigate_back_to_home
+            log.info("[WORKITEM] %s — navigating back home after skip", mva)
             navigate_back_to_home(driver)
             return res
 
         return res
 
     else:
-        log.warning(f"[WORKITEM][WARN] {mva} - could not click Add Work Item")
+        log.warning("[WORKITEM][WARN] %s - could not click Add Work Item", mva)
         return {"status": "failed", "reason": "add_btn", "mva": mva}
 
 
@@ -121,15 +199,15 @@ def handle_pm_workitems(driver, mva: str) -> dict:
 
 def process_workitem(driver, mva: str):
     """Main entry point for processing a Work Item for the given MVA."""
-    log.info(f"[WORKITEM] {mva} - starting process")
+    log.info("[WORKITEM] %s - starting process", mva)
 
     # Step 1: Gather existing Work Items
     tiles = get_work_items(driver, mva)
     total = len(tiles)
-    log.info(f"[WORKITEM] {mva} - {total} total work items found")
+    log.info("[WORKITEM] %s - %s total work items found", mva, total)
 
     if total == 0:
-        log.info(f"[WORKITEM][SKIP] {mva} - no PM work items found")
+        log.info("[WORKITEM][SKIP] %s - no PM work items found", mva)
         return {"status": "skipped", "reason": "no_pm_workitems", "mva": mva}
 
     # Step 2: Handle existing Open PM Work Items
@@ -141,60 +219,44 @@ def process_workitem(driver, mva: str):
 def open_pm_workitem_card(driver, mva: str, timeout: int = 8) -> dict:
     """Find and open the first Open PM Work Item card."""
     try:
-        tile = driver.find_element(
-            By.XPATH,
-            (
-                "//div[contains(@class,'scan-record-header') "
-                "and .//div[contains(@class,'scan-record-header-title')]"
-                "[normalize-space()='PM' or normalize-space()='PM Hard Hold - PM'] "
-                "and .//div[contains(@class,'scan-record-header-title-right')][normalize-space()='Open']]"
-            )
-        )
-        tile.click()
-        log.info(f"[WORKITEM] {mva} - Open PM Work Item card clicked")
+        batch = _collect_open_pm(driver, ["PM", "PM Hard Hold - PM"])
+        if not batch:
+            raise NoSuchElementException("no Open PM Work Item card")
+        batch.elements[0].click()
+        log.info("[WORKITEM] %s - Open PM Work Item card clicked (%r)", mva, batch.titles[0])
         return {"status": "ok", "reason": "card_opened", "mva": mva}
     except Exception as e:
-        log.warning(f"[WORKITEM][WARN] {mva} - could not open Open PM Work Item card -> {e}")
+        log.warning("[WORKITEM][WARN] %s - could not open Open PM Work Item card -> %s", mva, e)
         return {"status": "failed", "reason": "open_pm_card", "mva": mva}
 
 def complete_work_item_dialog(driver, note: str = "Done", timeout: int = 10, observe: int = 0) -> dict:
     """Fill the correction dialog with note and click 'Complete Work Item'."""
     try:
-        # 1) Wait for visible dialog root
-        dialog = safe_wait(
+        # 1) Wait for dialog, textarea and 'Complete Work Item' button in one in-page probe
+        dialog, textarea, complete_btn = safe_wait(
             driver,
             timeout,
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "div.bp6-dialog")),
+            lambda d: d.execute_script(_CORRECTION_DIALOG_JS),
             desc="Work Item dialog"
         )
 
         log.info("[DIALOG] Correction dialog opened")
 
-        # 2) Find textarea (scoped to dialog)
-        textarea = safe_wait(
-            driver,
-            timeout,
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "textarea.bp6-text-area")),
-            desc="Correction textarea"
-        )
-        #TODO: Clean up sleeps later
+        # 2) Enter the note
         textarea.click()
         textarea.clear()
-        time.sleep(5)
         textarea.send_keys(note)
-        time.sleep(5)
-        log.info(f"[DIALOG] Entered note text: {note!r}")
-        time.sleep(5)
+        log.info("[DIALOG] Entered note text: %r", note)
 
-        # 3) Click 'Complete Work Item'
-        complete_btn = safe_wait(
+        # 3) Click 'Complete Work Item' (may only enable once a note is present);
+        # count Complete PM items first so the wait below sees this one land
+        safe_wait(
             driver,
             timeout,
-            EC.element_to_be_clickable((By.XPATH, "//div[contains(@class,'bp6-dialog')]//button[normalize-space()='Complete Work Item']")),
+            EC.element_to_be_clickable(complete_btn),
             desc="Complete Work Item button"
         )
-        time.sleep(5)
-
+        completed_before = driver.execute_script(_PM_COMPLETE_JS) or 0
         complete_btn.click()
         log.info("[DIALOG] 'Complete Work Item' button clicked")
     
@@ -204,27 +266,33 @@ def complete_work_item_dialog(driver, note: str = "Done", timeout: int = 10, obs
 
         log.info("[DIALOG] Correction dialog closed")
 
-        # The issue might be that closing the UI short after clicking the button 
-        # doesn't give enough time for the backend to process the completion.
-        # Adding a longer wait here to ensure the process completes before proceeding.
-        time.sleep(30)
+        # Give the backend time to process the completion: wait (up to the old fixed
+        # 30s) for one more PM work item to report Complete rather than sleeping it out
+        try:
+            WebDriverWait(driver, 30).until(
+                lambda d: (d.execute_script(_PM_COMPLETE_JS) or 0) > completed_before
+            )
+        except TimeoutException:
+            log.warning("[DIALOG][WARN] PM work item not shown as Complete after 30s")
 
         return {"status": "ok"}
     except Exception as e:
-        log.error(f"[DIALOG][ERROR] complete_work_item_dialog -> {e}")
+        log.error("[DIALOG][ERROR] complete_work_item_dialog -> %s", e)
         return {"status": "failed", "reason": "dialog_exception"}
 
 
 
 def mark_complete_pm_workitem(driver, mva: str, note: str = "Done", timeout: int = 8) -> dict:
     """Click 'Mark Complete', then complete the dialog with the given note."""
-    if not click_element(driver, (By.CSS_SELECTOR, "button.fleet-operations-pwa__mark-complete-button__spuz8c")):
-        if not click_element(driver, (By.XPATH, "//button[normalize-space()='Mark Complete']")):
-            return {"status": "failed", "reason": "mark_complete_button", "mva": mva}
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: d.execute_script(_CLICK_MARK_COMPLETE_JS))
+    except TimeoutException:
+        log.warning("[MARKCOMPLETE][WARN] %s - Mark Complete button not found", mva)
+        return {"status": "failed", "reason": "mark_complete_button", "mva": mva}
+    log.info("[MARKCOMPLETE] %s - Mark Complete clicked", mva)
 
-    time.sleep(0.2)
     res = complete_work_item_dialog(driver, note=note, timeout=max(10, timeout), observe=1)
-    log.info(f"[MARKCOMPLETE] complete_work_item_dialog -> {res}")
+    log.info("[MARKCOMPLETE] complete_work_item_dialog -> %s", res)
 
     if res and res.get("status") == "ok":
         return {"status": "ok", "reason": "dialog_complete", "mva": mva}
@@ -236,13 +304,19 @@ def mark_complete_pm_workitem(driver, mva: str, note: str = "Done", timeout: int
 
 def complete_pm_workitem(driver, mva: str, timeout: int = 8) -> dict:
     """Open the PM Work Item card and mark it complete with note='Done'."""
-    time.sleep(9)  # wait for UI to stabilize
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located(_WORKITEM_HEADER_LOC)
+        )
+    except TimeoutException:
+        log.warning("[WORKITEM][WARN] %s - work item cards did not render", mva)
+        return {"status": "failed", "reason": "open_pm_card", "mva": mva}
+
     res = open_pm_workitem_card(driver, mva, timeout=timeout)
     if res.get("status") != "ok":
         return res  # pass through failure dict
-    time.sleep(9)  # wait for card to open
+
     res = mark_complete_pm_workitem(driver, mva, note="Done", timeout=timeout)
-    time.sleep(9)  # wait for completion to process
     if res.get("status") == "ok":
         return {"status": "ok", "reason": "completed_open_pm", "mva": mva}
     else:
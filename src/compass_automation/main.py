@@ -1,20 +1,17 @@
-import time
+from concurrent.futures import ThreadPoolExecutor
+
 from compass_automation.core import driver_manager
 from compass_automation.pages.login_page import LoginPage
 from compass_automation.pages.mva_input_page import MVAInputPage
 from compass_automation.config.config_loader import get_config
 from compass_automation.utils.logger import log
 from compass_automation.utils.data_loader import load_mvas
-from compass_automation.utils.ui_helpers import is_mva_known, navigate_back_to_home
+from compass_automation.utils.ui_helpers import get_vehicle_snapshot, navigate_back_to_home
 from compass_automation.flows.work_item_flow import handle_pm_workitems
 
-def main():
-    log.info("Starting Compass automation...")
-
-    driver = driver_manager.get_or_create_driver()
-    log.debug(f"Driver obtained: {driver}")
 
-    # Login
+def login(driver) -> bool:
+    """Run the login + Compass Mobile + WWID setup on the given driver."""
     login_page = LoginPage(driver)
     log.info("Login page loaded.")
     res = login_page.ensure_ready(
@@ -25,59 +22,109 @@ def main():
     log.info("Login page ready.")
 
     if res.get("status") != "ok":
-        log.error(f"Login failed: {res}")
+        log.error("Login failed: %s", res)
+        return False
+    return True
+
+
+def process_mva(driver, mva: str) -> None:
+    """Enter one MVA and handle its PM work items."""
+    log.info("=" * 80)
+    log.info(">>> Starting MVA %s", mva)
+    log.info("=" * 80)
+
+    # Enter the MVA
+    mva_page = MVAInputPage(driver)
+    field = mva_page.find_input()
+    if not field:
+        log.error("[MVA] %s — input field not found", mva)
         return
 
-    time.sleep(1)  # Allow page to settle
+    field.clear()
+    field.send_keys(mva)
 
-    # Load MVAs from CSV
-    try:
-        mvas = load_mvas("data/mva.csv")
-        log.info(f"Loaded {len(mvas)} MVAs from data/mva.csv")
-    except FileNotFoundError:
-        log.error("data/mva.csv not found. Please create the file with MVA numbers.")
+    # Check if MVA is valid (waits for the vehicle panel to echo it; no fixed sleep).
+    # Lighthouse is not used here, so no grace is spent waiting for it.
+    if not get_vehicle_snapshot(driver, mva, lighthouse_grace=0)["known"]:
+        log.warning("[MVA] %s — invalid/unknown MVA, skipping", mva)
         return
-    except Exception as e:
-        log.error(f"Error loading MVAs: {e}")
+
+    # Handle PM Work Items
+    res = handle_pm_workitems(driver, mva)
+
+    if res.get("status") in ("ok", "closed"):
+        log.info("[WORKITEM] %s — flow completed successfully", mva)
+    elif res.get("status") == "skipped_no_complaint":
+        # Back to the MVA input screen in-app; the SSO session is kept
+        log.info("[WORKITEM] %s — navigating back home after skip", mva)
+        navigate_back_to_home(driver)
+    else:
+        log.warning("[WORKITEM] %s — failed flow: %s", mva, res)
+
+
+def process_shard(driver, mvas, profile_dir=None) -> None:
+    """
+    Process a shard of MVAs on one Edge instance.
+
+    If driver is None a dedicated instance is launched on profile_dir,
+    logged in, and quit when the shard is done.
+    """
+    owns_driver = driver is None
+    if owns_driver:
+        driver = driver_manager.create_driver(user_data_dir=profile_dir)
+    try:
+        if owns_driver and not login(driver):
+            return
+        for mva in mvas:
+            process_mva(driver, mva)
+    finally:
+        if owns_driver:
+            driver.quit()
+
+
+def main():
+    log.info("Starting Compass automation...")
+
+    # Launch Edge on a worker thread while the MVA list is read from disk
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        driver_future = executor.submit(driver_manager.get_or_create_driver)
+
+        # Load MVAs from CSV
+        mvas = None
+        try:
+            mvas = load_mvas("data/mva.csv")
+            log.info("Loaded %s MVAs from data/mva.csv", len(mvas))
+        except FileNotFoundError:
+            log.error("data/mva.csv not found. Please create the file with MVA numbers.")
+        except Exception as e:
+            log.error("Error loading MVAs: %s", e)
+
+        driver = driver_future.result()
+    log.debug("Driver obtained: %s", driver)
+
+    if mvas is None:
         return
 
     if not mvas:
         log.warning("No MVAs found in data/mva.csv")
         return
 
-    # Process each MVA
-    for mva in mvas:
-        log.info("=" * 80)
-        log.info(f">>> Starting MVA {mva}")
-        log.info("=" * 80)
-
-        # Enter the MVA
-        mva_page = MVAInputPage(driver)
-        field = mva_page.find_input()
-        if not field:
-            log.error(f"[MVA] {mva} — input field not found")
-            continue
-
-        field.clear()
-        field.send_keys(mva)
-        time.sleep(3)  # Reduced from 5s
-
-        # Check if MVA is valid
-        if not is_mva_known(driver, mva):
-            log.warning(f"[MVA] {mva} — invalid/unknown MVA, skipping")
-            continue
-
-        # Handle PM Work Items
-        res = handle_pm_workitems(driver, mva)
-
-        if res.get("status") in ("ok", "closed"):
-            log.info(f"[WORKITEM] {mva} — flow completed successfully")
-        elif res.get("status") == "skipped_no_complaint":
-            log.info(f"[WORKITEM] {mva} — navigating back home after skip")
-            navigate_back_to_home(driver)
-            time.sleep(2)  # Reduced from 5s
-        else:
-            log.warning(f"[WORKITEM] {mva} — failed flow: {res}")
+    # Login
+    if not login(driver):
+        return
+
+    # Process MVAs: sequentially on the singleton, or sharded across extra Edge instances
+    workers = max(1, min(int(get_config("parallel_workers", 1)), len(mvas)))
+    if workers == 1:
+        process_shard(driver, mvas)
+    else:
+        log.info("Processing %s MVAs across %s Edge instances", len(mvas), workers)
+        shards = [mvas[i::workers] for i in range(workers)]
+        drivers = [driver] + [None] * (workers - 1)
+        # One persistent profile per extra worker; Edge locks a profile to one process
+        profiles = [None] + [f"{driver_manager.PROFILE_DIR}_w{i}" for i in range(1, workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(process_shard, drivers, shards, profiles))
 
     log.info("Automation run complete.")
 
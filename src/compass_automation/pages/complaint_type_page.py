@@ -75,10 +75,10 @@ class ComplaintTypePage(BasePage):
                 "arguments[0].scrollIntoView({block:'center'});", btn
             )
             btn.click()
-            log.info(f"[COMPLAINT] {mva or ''} - PM tile clicked (auto-forward)")
+            log.info("[COMPLAINT] %s - PM tile clicked (auto-forward)", mva or '')
             return True
         except Exception as e:
             log.warning(
-                f"[COMPLAINT][WARN] {mva or ''} - PM tile not found/clickable ({e})"
+                "[COMPLAINT][WARN] %s - PM tile not found/clickable (%s)", mva or '', e
             )
             return False
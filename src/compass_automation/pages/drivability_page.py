@@ -1,21 +1,15 @@
 from __future__ import annotations
 
-import time
 from typing import Tuple
 
-from .base_page import BasePage
-
-try:
-    from selenium.webdriver.common.by import By
-except Exception:
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
-    class _By:
-        CSS_SELECTOR = "css selector"
-        XPATH = "xpath"
-        ID = "id"
-        NAME = "name"
+from compass_automation.utils.ui_helpers import settle
 
-    By = _By()  # type: ignore
+from .base_page import BasePage
 
 
 class DrivabilityPage(BasePage):
@@ -24,12 +18,13 @@ class DrivabilityPage(BasePage):
             By.CSS_SELECTOR,
             "div.bp6-dialog[data-testid='drivability-page'], div.fleet-operations-pwa__drivabilityPage",
         )
-        # Use the container and the H1 text the page actually renders
-        YES_BTN = (
+        # Use the container and the H1 text the page actually renders.
+        # The click path resolves the same buttons in-page via _FIND_BUTTON_FN.
+        YES_BTN: Tuple[str, str] = (
             By.XPATH,
             "//div[contains(@class,'drivable-options-container')]//button[.//h1[normalize-space()='Yes']]",
         )
-        NO_BTN = (
+        NO_BTN: Tuple[str, str] = (
             By.XPATH,
             "//div[contains(@class,'drivable-options-container')]//button[.//h1[normalize-space()='No']]",
         )
@@ -40,19 +35,59 @@ class DrivabilityPage(BasePage):
             "/following::button[.//span[normalize-space()='Next'] or normalize-space()='Next'][1]",
         )
 
+    # findButton('Yes'|'No') -> option button by its h1 text; findButton('Next') -> first
+    # Next button after the drivable header. CSS + text filtering, no XPath axes.
+    _FIND_BUTTON_FN = """
+const norm = el => (el.textContent || '').replace(/\\s+/g, ' ').trim();
+function findButton(label) {
+    if (label === 'Next') {
+        const header = document.querySelector("div[class*='drivable-header-container']");
+        return (header && Array.from(document.querySelectorAll('button')).find(b =>
+            (header.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING)
+            && !header.contains(b) && norm(b) === 'Next')) || null;
+    }
+    return Array.from(document.querySelectorAll("div[class*='drivable-options-container'] button"))
+        .find(b => Array.from(b.querySelectorAll('h1')).some(h => norm(h) === label)) || null;
+}
+"""
+    # arguments[0]: button label; returns the button if present and enabled, else null
+    BUTTON_JS = _FIND_BUTTON_FN + """
+const btn = findButton(arguments[0]);
+return (btn && !btn.disabled) ? btn : null;
+"""
+    # Presence of all three buttons in one round trip
+    STATE_JS = _FIND_BUTTON_FN + """
+return {yes: !!findButton('Yes'), no: !!findButton('No'), next: !!findButton('Next')};
+"""
+
+    def _button(self, label: str):
+        return self.driver.execute_script(self.BUTTON_JS, label)
+
     def ensure_open(self) -> None:
         self.find(By.XPATH, "//h1[normalize-space()='Is vehicle drivable?']")
 
     def select_drivable(self, drivable: bool) -> None:
-        btn = self.S.YES_BTN if drivable else self.S.NO_BTN
-        self.find(*btn).click()
-        time.sleep(0.3)
+        label = "Yes" if drivable else "No"
+        btn = self._button(label)
+        if btn is None:
+            raise NoSuchElementException(f"Drivable option {label!r} not found")
+        btn.click()
+        # Next enables once a choice is registered
+        WebDriverWait(self.driver, 10).until(lambda d: self._button("Next"))
 
     def click_next(self) -> None:
-        self.find(*self.S.NEXT_BTN).click()
-        time.sleep(0.5)
+        next_btn = self._button("Next")
+        if next_btn is None:
+            raise NoSuchElementException("Drivability Next button not found")
+        next_btn.click()
+        # Return as soon as the page moves on (button hidden or detached); a footer
+        # Next reused by the following step just runs out the old 0.5s settle, no raise
+        settle(self.driver, EC.invisibility_of_element(next_btn), max_wait=0.5)
 
+    def dialog_state(self) -> dict:
+        """Return {'yes': bool, 'no': bool, 'next': bool} for the buttons currently rendered."""
+        return self.driver.execute_script(self.STATE_JS)
 
-def has_next_button(self) -> bool:
-    """Return True if the Next button is visible on the drivability page."""
-    return bool(self.driver.find_elements(*self.S.NEXT_BTN))
+    def has_next_button(self) -> bool:
+        """Return True if the Next button is present on the drivability page."""
+        return bool(self.dialog_state().get("next"))
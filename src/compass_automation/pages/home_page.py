@@ -1,3 +1,6 @@
+import weakref
+from functools import cached_property
+
 from compass_automation.utils.logger import log
 
 from selenium.webdriver.support.ui import WebDriverWait
@@ -6,16 +9,25 @@ from selenium.webdriver.support.ui import WebDriverWait
 class HomePage:
     """A Page Object for a generic home page."""
 
+    # Drivers already maximized; a window stays maximized across navigations
+    _maximized = weakref.WeakSet()
+
     def __init__(self, driver):
         """Initializes the Page Object with a WebDriver instance."""
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, 10)
+
+    @cached_property
+    def wait(self):
+        """WebDriverWait(10) for this page, built on first use."""
+        return WebDriverWait(self.driver, 10)
 
     def go_to_page(self, url):
         """Navigates to the specified URL."""
         self.driver.get(url)
-        self.driver.maximize_window()
+        if self.driver not in HomePage._maximized:
+            self.driver.maximize_window()
+            HomePage._maximized.add(self.driver)
 
     def print_page_title(self):
         """Prints the title of the current page."""
-        log.info(f"Current Page Title: {self.driver.title}")
+        log.info("Current Page Title: %s", self.driver.title)
@@ -1,40 +1,64 @@
-import json
 import time
 import pytest
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 
+from compass_automation.config.config_loader import get_config
 from compass_automation.core.navigator import Navigator
-from compass_automation.utils.project_paths import ProjectPaths
 from compass_automation.utils.logger import log
-from compass_automation.utils.ui_helpers import click_element, safe_wait, send_text
+from compass_automation.utils.ui_helpers import click_element, safe_wait
+
+_LOGIN_URL = "https://avisbudget.palantirfoundry.com/multipass/login"
+# Existence check in-page via the CSS matcher (no XPath evaluator, no implicit wait):
+# the Compass Mobile launcher span only renders for an authenticated Foundry session
+_COMPASS_MOBILE_PRESENT_JS = (
+    "return Array.from(document.querySelectorAll(\"a[role='button'] span\"))"
+    ".some(s => s.textContent.includes('Compass Mobile'));"
+)
+_COMPASS_MOBILE_BTN_LOC = (By.XPATH, "//a[@role='button']//span[normalize-space()='Compass Mobile']")
+_EMAIL_LOC = (By.NAME, "loginfmt")
+_PASSWORD_LOC = (By.NAME, "passwd")
+_SIGN_IN_BTN_LOC = (By.ID, "idSIButton9")
+_STAY_SIGNED_IN_NO_LOC = (By.ID, "idBtn_Back")
+_WWID_INPUT_LOC = (By.CSS_SELECTOR, "input[class*='fleet-operations-pwa__text-input__']")
+_CAMERA_BTN_LOC = (By.XPATH, "//button[contains(@class,'fleet-operations-pwa__camera-button')]")
+# Set the WWID through the native value setter (so React sees it) and click Submit.
+# arguments[0]: input element, arguments[1]: WWID. Returns 'ok', 'mismatch' or 'no_submit'.
+_SUBMIT_WWID_JS = """
+const inp = arguments[0], value = arguments[1];
+const setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+inp.focus();
+setter.call(inp, value);
+inp.dispatchEvent(new Event('input', {bubbles: true}));
+inp.dispatchEvent(new Event('change', {bubbles: true}));
+if (inp.value !== value) return 'mismatch';
+const btn = Array.from(document.querySelectorAll('button'))
+    .find(b => b.textContent.replace(/\\s+/g, ' ').trim() === 'Submit');
+if (!btn) return 'no_submit';
+btn.click();
+return 'ok';
+"""
 
 
 class LoginPage:
     def __init__(self, driver):
         self.driver = driver
-
-        # Use centralized path management
-        config_path = ProjectPaths.get_config_path()
-        with open(config_path, "r") as f:
-            config = json.load(f)
-            self.delay_seconds = config.get("delay_seconds", 4)
+        # config.json is parsed once per process by config_loader
+        self.delay_seconds = get_config("delay_seconds", 4)
 
     def is_logged_in(self):
         """Check if Compass Mobile session is already authenticated."""
         
-        log.info(f"[DEBUG] inside is_logged_in")
-        elems = self.driver.find_elements(By.XPATH, "//span[contains(text(),'Compass Mobile')]")
-        return len(elems) > 0
+        log.info("[DEBUG] inside is_logged_in")
+        return bool(self.driver.execute_script(_COMPASS_MOBILE_PRESENT_JS))
 
     def ensure_logged_in(self, username: str, password: str, login_id: str):
         # Always navigate first
-        Navigator(self.driver).go_to(
-            "https://avisbudget.palantirfoundry.com/multipass/login", label="Login page"
-        )
+        Navigator(self.driver).go_to(_LOGIN_URL, label="Login page")
 
         if self.is_logged_in():
             log.info("[LOGIN] Session already authenticated - reusing it.")
@@ -46,135 +70,120 @@ class LoginPage:
     def enter_wwid(self, login_id: str):
         """Actually type and submit the WWID once."""
         try:
-            safe_wait(
-                self.driver,
-                10,
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "input[class*='fleet-operations-pwa__text-input__']")
-                ),
-                desc="WWID input"
+            wwid_input = WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located(_WWID_INPUT_LOC)
             )
-
         except TimeoutException:
-            log.warning(f"[LOGIN][WARN] Timed out waiting for WWID field")
+            log.warning("[LOGIN][WARN] Timed out waiting for WWID field")
             return {"status": "failed", "reason": "wwid_field_timeout"}
 
         try:
-            # Use send_text for the actual entry
-            if not send_text(
-                self.driver,
-                (By.CSS_SELECTOR, "input[class*='fleet-operations-pwa__text-input__']"),
-                login_id,
-            ):
+            # Set the value and click Submit in one script instead of send_text + click_element
+            result = self.driver.execute_script(_SUBMIT_WWID_JS, wwid_input, login_id)
+            if result == "mismatch":
                 return {"status": "failed", "reason": "wwid_entry_failed"}
+            if result == "no_submit":
+                log.warning("[LOGIN][WARN] Could not click WWID submit button")
+                return {"status": "failed", "reason": "wwid_submit_failed"}
+            log.info("[LOGIN] WWID submitted via button")
 
-            # Press Enter (special key -> keep raw)
-            self.driver.find_element(
-                By.CSS_SELECTOR, "input[class*='fleet-operations-pwa__text-input__']"
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located(_CAMERA_BTN_LOC)
             )
-            if not click_element(self.driver, (By.XPATH, "//button[.//span[normalize-space()='Submit']]")):
-                log.warning(f"[LOGIN][WARN] Could not click WWID submit button")
-                return {"status": "failed", "reason": "wwid_submit_failed"}
-            log.info(f"[LOGIN] WWID submitted via button")
             return {"status": "ok"}
-            # time.sleep(5)
-
-
+        except TimeoutException:
+            log.warning("[LOGIN][WARN] MVA home screen did not appear after WWID submit")
+            return {"status": "failed", "reason": "wwid_not_accepted"}
         except Exception as e:
-            log.error(f"[LOGIN][ERROR] Unexpected error entering WWID: {e}")
+            log.error("[LOGIN][ERROR] Unexpected error entering WWID: %s", e)
             return {"status": "failed", "reason": "exception"}
 
     def login(self, username: str, password: str, login_id: str):
         """Perform login flow: email -> password -> stay signed in"""
         # Navigation via Navigator (SRP)
         
-        log.info(f"[DEBUG] inside login()")
-        Navigator(self.driver).go_to(
-            "https://avisbudget.palantirfoundry.com/multipass/login", label="Login page"
-        )
+        log.info("[DEBUG] inside login()")
+        Navigator(self.driver).go_to(_LOGIN_URL, label="Login page")
 
         # --- Email ---
         email_field = safe_wait(
             self.driver,
             10,
-            EC.presence_of_element_located((By.NAME, "loginfmt")),
+            EC.presence_of_element_located(_EMAIL_LOC),
             "email_field",
         )
         if not email_field:
-            log.warning(f"[LOGIN] Email field not found (timeout)")
+            log.warning("[LOGIN] Email field not found (timeout)")
             return {"status": "failed", "reason": "timeout_email_field"}
 
-        log.info(f"[LOGIN] Typing email: {username}")
+        log.info("[LOGIN] Typing email: %s", username)
         email_field.send_keys(username)
 
         ## Click Next button to proceed to password
-        log.info(f"[LOGIN] Clicking Next button after email")
+        log.info("[LOGIN] Clicking Next button after email")
 
-        if not click_element(self.driver, (By.ID, "idSIButton9")):            
+        if not click_element(self.driver, _SIGN_IN_BTN_LOC):            
             return {"status": "failed", "reason": "timeout_next_button"}
         # --- Password ---
         password_field = safe_wait(
             self.driver,
             10,
-            EC.presence_of_element_located((By.NAME, "passwd")),
+            EC.presence_of_element_located(_PASSWORD_LOC),
             "password_field",
         )
 
         
 
         if not password_field:
-            log.warning(f"[LOGIN] Password field not found (timeout)")
+            log.warning("[LOGIN] Password field not found (timeout)")
             return {"status": "failed", "reason": "timeout_password_field"}
 
-        log.info(f"[LOGIN] Typing password")
+        log.info("[LOGIN] Typing password")
         password_field.send_keys(password)
-        log.info(f"[LOGIN] Password entered")
+        log.info("[LOGIN] Password entered")
 
         log.info("[LOGIN] Clicking Sign in after password")
-        if not click_element(self.driver, (By.ID, "idSIButton9"), desc="Sign in button"):
+        if not click_element(self.driver, _SIGN_IN_BTN_LOC, desc="Sign in button"):
             return {"status": "failed", "reason": "click_password_next"}
 
-        log.info(f"[LOGIN] Clicked Sign in appears to have worked")
+        log.info("[LOGIN] Clicked Sign in appears to have worked")
         time.sleep(2)
 
         # --- Stay signed in? ---
         no_btn = safe_wait(
             self.driver,
             3,
-            EC.element_to_be_clickable((By.ID, "idBtn_Back")),
+            EC.element_to_be_clickable(_STAY_SIGNED_IN_NO_LOC),
             "stay_signed_in_no",
         )
         if no_btn:
-            log.info(f"[LOGIN] Dismissing 'Stay signed in?' dialog with No")
+            log.info("[LOGIN] Dismissing 'Stay signed in?' dialog with No")
             no_btn.click()
             time.sleep(1)
         else:
-            log.info(f"[LOGIN] 'Stay signed in?' dialog not shown")
+            log.info("[LOGIN] 'Stay signed in?' dialog not shown")
 
         return {"status": "ok"}
 
     def go_to_mobile_home(self):
         """Navigate from Foundry to Compass Mobile tab and verify WWID screen appears."""
+        # Synchronization point after login: returns as soon as the button is usable,
+        # with delay_seconds (the old fixed pause) folded into the upper bound
         mobile_btn = safe_wait(
             self.driver,
-            10,
-            EC.element_to_be_clickable(
-                (
-                    By.XPATH,
-                    "//a[@role='button']//span[normalize-space()='Compass Mobile']",
-                )
-            ),
+            max(10, self.delay_seconds),
+            EC.element_to_be_clickable(_COMPASS_MOBILE_BTN_LOC),
             "compass_mobile_button",
         )
 
         if not mobile_btn:
-            log.warning(f"[LOGIN][WARN] Compass Mobile button not found")
+            log.warning("[LOGIN][WARN] Compass Mobile button not found")
             return {"status": "failed", "reason": "compass_mobile_button_missing"}
 
         # Save current tab count
         prev_tabs = len(self.driver.window_handles)
 
-        log.info(f"[LOGIN] Clicking Compass Mobile button")
+        log.info("[LOGIN] Clicking Compass Mobile button")
         mobile_btn.click()
 
         safe_wait(
@@ -195,15 +204,13 @@ class LoginPage:
 
         # Switch to newest tab
         self.driver.switch_to.window(self.driver.window_handles[-1])
-        log.info(f"[LOGIN] Switched to Compass Mobile tab")
+        log.info("[LOGIN] Switched to Compass Mobile tab")
 
         # Verify WWID field exists
         wwid_field = safe_wait(
             self.driver,
             10,
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "input[class*='fleet-operations-pwa__text-input__']")
-            ),
+            EC.presence_of_element_located(_WWID_INPUT_LOC),
             "wwid_input_field",
         )
         if not wwid_field:
@@ -212,12 +219,12 @@ class LoginPage:
             )
             return {"status": "failed", "reason": "wwid_field_missing"}
 
-        log.info(f"[LOGIN] WWID input field detected")
+        log.info("[LOGIN] WWID input field detected")
         return {"status": "ok"}
 
     def ensure_user_context(self, login_id: str):
         """Ensure WWID is entered once Compass Mobile is loaded."""
-        log.info(f"[LOGIN] Proceeding to WWID entry")
+        log.info("[LOGIN] Proceeding to WWID entry")
         return self.enter_wwid(login_id)
 
     def ensure_ready(self, username: str, password: str, login_id: str):
@@ -227,11 +234,10 @@ class LoginPage:
         2) go_to_mobile_home
         3) ensure_user_context(WWID)
         """
-        log.info(f"[DEBUG] before ensure_logged_in")
+        log.info("[DEBUG] before ensure_logged_in")
 
         res = self.ensure_logged_in(username, password, login_id)
-        log.debug(f"[LOGIN] ensure_logged_in -> {res}")
-        time.sleep(self.delay_seconds)
+        log.debug("[LOGIN] ensure_logged_in -> %s", res)
         if res["status"] != "ok":
             return res
 
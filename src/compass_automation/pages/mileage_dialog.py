@@ -21,6 +21,14 @@ except Exception:
 
     By = _By()  # type: ignore
 
+# Polled by has_next_button: module constant, no class attribute lookup per call.
+# Scoped to the dialog so other primary buttons on the page never match.
+_NEXT_BTN: Tuple[str, str] = (
+    By.CSS_SELECTOR,
+    "div[data-testid='mileage-dialog'] button[data-testid='mileage-next'], "
+    "div.fleet-operations-pwa__mileageDialog button.bp6-button.bp6-intent-primary",
+)
+
 
 class MileageDialog(BasePage):
     """Represents the Mileage entry dialog in the Work Item flow."""
@@ -35,10 +43,7 @@ class MileageDialog(BasePage):
             By.CSS_SELECTOR,
             "input[data-testid='mileage-input'], input.fleet-operations-pwa__mileageInput",
         )
-        NEXT_BTN: Tuple[str, str] = (
-            By.CSS_SELECTOR,
-            "button[data-testid='mileage-next'], button.bp6-button.bp6-intent-primary",
-        )
+        NEXT_BTN = _NEXT_BTN
 
     # ---- Public API (stubs) ------------------------------------------------
     def ensure_open(self) -> None:
@@ -55,4 +60,4 @@ class MileageDialog(BasePage):
 
     def has_next_button(self) -> bool:
         """Return True if the Next button is visible on the mileage dialog."""
-        return bool(self.driver.find_elements(*self.S.NEXT_BTN))
+        return bool(self.driver.find_elements(*_NEXT_BTN))
@@ -5,26 +5,31 @@ from compass_automation.utils.ui_helpers import find_element
 
 
 class MVAInputPage:
-    # Defensive locators for MVA input
-    CANDIDATES = [
-        (By.CSS_SELECTOR, "input.bp6-input[placeholder*='Enter MVA']"),
-        (By.XPATH, "//input[@type='text' and contains(@placeholder,'MVA')]"),
-        (
-            By.XPATH,
-            "//div[@role='tabpanel' and @aria-hidden='false']//input[@type='text']",
-        ),
-    ]
+    # Defensive locators for MVA input: both placeholder variants in one CSS
+    # selector (one wait), then the active-tabpanel input as a last resort
+    INPUT = (
+        By.CSS_SELECTOR,
+        "input.bp6-input[placeholder*='Enter MVA'], input[type='text'][placeholder*='MVA']",
+    )
+    FALLBACK = (
+        By.XPATH,
+        "//div[@role='tabpanel' and @aria-hidden='false']//input[@type='text']",
+    )
 
     def __init__(self, driver):
         self.driver = driver
 
     def find_input(self):
         """Return the active MVA input field by probing multiple locators."""
-        for locator in self.CANDIDATES:
-            try:
-                return find_element(self.driver, locator, timeout=4)
-            except Exception:
-                continue
+        try:
+            return find_element(self.driver, self.INPUT, timeout=4)
+        except Exception:
+            pass
 
-        log.info(f"[MVA_INPUT] No candidate locator matched — input field not found")
+        # Page has had the wait above to render; no second timeout for the fallback
+        fallback = self.driver.find_elements(*self.FALLBACK)
+        if fallback:
+            return fallback[0]
+
+        log.info("[MVA_INPUT] No candidate locator matched — input field not found")
         return None  # swallow instead of raising
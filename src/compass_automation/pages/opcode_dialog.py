@@ -5,6 +5,8 @@ from __future__ import annotations
 
 from typing import Tuple
 
+from compass_automation.utils.xpath import xpath_literal
+
 from .base_page import BasePage
 
 try:
@@ -19,6 +21,21 @@ except Exception:
 
     By = _By()  # type: ignore
 
+# Locators used on the selection path live at module scope (plain global lookups).
+# XPath mirror of S.OPCODE_ITEM | S.OPCODE_LABEL with a {} slot for the quoted name,
+# so the text match happens in-browser in one lookup.
+_OPCODE_MATCH_TPL: str = (
+    "//div[@data-testid='opcode-item' or contains(@class,'fleet-operations-pwa__opcodeItem')]"
+    "[normalize-space()={0}]"
+    " | //*[(self::span and contains(@class,'opcode-label'))"
+    " or (self::div and contains(@class,'fleet-operations-pwa__opcodeLabel'))]"
+    "[normalize-space()={0}]"
+)
+_CREATE_BTN: Tuple[str, str] = (
+    By.CSS_SELECTOR,
+    "button[data-testid='opcode-create'], button.bp6-button.bp6-intent-primary",
+)
+
 
 class OpcodeDialog(BasePage):
     """Represents the Opcode selection dialog (â‰ˆ20 options, incl. PM Gas)."""
@@ -37,10 +54,8 @@ class OpcodeDialog(BasePage):
             By.CSS_SELECTOR,
             "span.opcode-label, div.fleet-operations-pwa__opcodeLabel",
         )
-        CREATE_BTN: Tuple[str, str] = (
-            By.CSS_SELECTOR,
-            "button[data-testid='opcode-create'], button.bp6-button.bp6-intent-primary",
-        )
+        OPCODE_MATCH_TPL = _OPCODE_MATCH_TPL
+        CREATE_BTN = _CREATE_BTN
 
     # ---- Public API (stubs) ------------------------------------------------
     def ensure_open(self) -> None:
@@ -48,30 +63,19 @@ class OpcodeDialog(BasePage):
         pass
 
     def select_opcode(self, name: str) -> bool:
-        # Try clicking an opcode item whose visible text (or child label) matches `name`.
-        items = self.driver.find_elements(*self.S.OPCODE_ITEM)
-        target = name.strip()
-        for el in items:
+        # Click the first opcode item (or child label) whose visible text matches `name`.
+        xp = _OPCODE_MATCH_TPL.format(xpath_literal(name.strip()))
+        for el in self.driver.find_elements(By.XPATH, xp):
             try:
-                if el.text.strip() == target:
-                    el.click()
-                    return True
-                label = el.find_element(*self.S.OPCODE_LABEL)
-                if label.text.strip() == target:
-                    label.click()
-                    return True
+                el.click()
+                return True
             except Exception:
                 continue
-        # Fallback: click any matching label in the dialog.
-        for lb in self.driver.find_elements(*self.S.OPCODE_LABEL):
-            if lb.text.strip() == target:
-                lb.click()
-                return True
         return False
 
     def click_create(self) -> bool:
         try:
-            self.driver.find_element(*self.S.CREATE_BTN).click()
+            self.driver.find_element(*_CREATE_BTN).click()
             return True
         except Exception:
             return False
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional
 
 
 @dataclass(slots=True)
@@ -36,8 +36,14 @@ class Vehicle:
     alert_status_reason: Optional[str] = None
     trunk_key: Optional[str] = None
 
-    def age_in_days(self) -> Optional[int]:
+    def age_in_days(self, now: Optional[datetime] = None) -> Optional[int]:
         """Return age in days since purchase, or None if purchase_date is missing."""
         if not self.purchase_date:
             return None
-        return (datetime.now() - self.purchase_date).days
+        return ((now or datetime.now()) - self.purchase_date).days
+
+    @classmethod
+    def ages_for(cls, vehicles: Iterable[Vehicle], now: Optional[datetime] = None) -> List[Optional[int]]:
+        """Return age_in_days for each vehicle, reading the clock once for the whole batch."""
+        now = now or datetime.now()
+        return [v.age_in_days(now) for v in vehicles]
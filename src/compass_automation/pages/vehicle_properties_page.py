@@ -1,7 +1,7 @@
 from selenium.webdriver.common.by import By
 
 from compass_automation.utils.logger import log
-from compass_automation.utils.ui_helpers import find_element
+from compass_automation.utils.ui_helpers import find_element, xpath_literal
 
 
 class VehiclePropertiesPage:
@@ -10,25 +10,23 @@ class VehiclePropertiesPage:
 
     def find_mva_echo(self, last8: str, timeout: int = 8):
         """Return the element where the vehicle properties panel echoes the given last8 MVA."""
+        value = xpath_literal(last8)
+        xp_any_value_contains = (
+            "//div[contains(@class,'vehicle-properties-container')]"
+            f"//div[contains(@class,'vehicle-property-value')][contains(normalize-space(), {value})]"
+        )
         try:
-            xp_by_label = (
-                "//div[contains(@class,'vehicle-properties-container')]"
-                "//div[contains(@class,'vehicle-property__')]"
-                "[div[contains(@class,'vehicle-property-name')][normalize-space()='MVA']]"
-                f"/div[contains(@class,'vehicle-property-value')][contains(normalize-space(), '{last8}')]"
-            )
-            return find_element(self.driver, (By.XPATH, xp_by_label), timeout=timeout)
+            match = find_element(self.driver, (By.XPATH, xp_any_value_contains), timeout=timeout)
         except Exception:
-            try:
-                xp_any_value_contains = (
-                    "//div[contains(@class,'vehicle-properties-container')]"
-                    f"//div[contains(@class,'vehicle-property-value')][contains(normalize-space(), '{last8}')]"
-                )
-                return find_element(
-                    self.driver, (By.XPATH, xp_any_value_contains), timeout=3
-                )
-            except Exception:
-                log.error(
-                    "[MVA][ERROR] echoed value not found (looked for last8='{last8}')"
-                )
-                return None
+            log.error("[MVA][ERROR] echoed value not found (looked for last8='%s')", last8)
+            return None
+
+        # Panel has rendered; prefer the value under the 'MVA' label without another wait
+        xp_by_label = (
+            "//div[contains(@class,'vehicle-properties-container')]"
+            "//div[contains(@class,'vehicle-property__')]"
+            "[div[contains(@class,'vehicle-property-name')][normalize-space()='MVA']]"
+            f"/div[contains(@class,'vehicle-property-value')][contains(normalize-space(), {value})]"
+        )
+        by_label = self.driver.find_elements(By.XPATH, xp_by_label)
+        return by_label[0] if by_label else match
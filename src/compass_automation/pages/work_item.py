@@ -19,11 +19,12 @@ class WorkItem:
     status: Status
     completed_at: Optional[datetime] = None
 
+    # status keeps the UI text as given; only the checks below ignore case
     def is_open(self) -> bool:
-        return self.status.lower() == "open"
+        return self.status.casefold() == "open"
 
     def is_complete(self) -> bool:
-        return self.status.lower() == "complete"
+        return self.status.casefold() == "complete"
 
     def age_in_days(self) -> Optional[int]:
         """Return age in days since completion, or None if no completed_at."""
@@ -2,8 +2,13 @@
 import csv
 
 
-def load_mvas(csv_path="data/mva.csv"):
+def iter_mvas(csv_path="data/mva.csv"):
+    """Yield MVAs one row at a time, skipping blank rows and '#' comments."""
     with open(csv_path, newline="") as csvfile:
-        reader = csv.reader(csvfile)
-        mvas = [row[0].strip() for row in reader if row and not row[0].startswith("#")]
-    return mvas
+        for row in csv.reader(csvfile):
+            if row and not row[0].startswith("#"):
+                yield row[0].strip()
+
+
+def load_mvas(csv_path="data/mva.csv"):
+    return list(iter_mvas(csv_path))
@@ -1,7 +1,26 @@
+import atexit
 import logging
+import queue
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+
 from compass_automation.config.config_loader import get_config
 
-class ColorFormatter(logging.Formatter):
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders asctime once per wall-clock second instead of per record."""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:  # default format includes milliseconds; nothing to share
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached = getattr(self, "_ts_cache", None)  # (sec, datefmt, text); one attribute read
+        if cached is not None and cached[0] == sec and cached[1] == datefmt:
+            return cached[2]
+        text = super().formatTime(record, datefmt)
+        self._ts_cache = (sec, datefmt, text)
+        return text
+
+
+class ColorFormatter(CachedTimeFormatter):
     COLORS = {
         "DEBUG": "\033[36m",    # cyan
         "INFO": "\033[37m",     # white
@@ -16,13 +35,27 @@ class ColorFormatter(logging.Formatter):
         message = super().format(record)
         return f"{color}{message}{self.RESET}"
 
+# Level names accepted in config, resolved with a single dict lookup
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 # Get log level and format from config
-log_level = get_config('logging.level', 'INFO').upper()
+log_level = str(get_config('logging.level', 'INFO')).strip().upper()
 log_format = get_config('logging.format', "[%(levelname)s] [%(name)s] [%(asctime)s] %(message)s")
 
-# Create one logger instance for the whole project
+_LISTENER = None  # background file writer, started with the handlers below
+
+# Create one logger instance for the whole project.
+# Pass values as %-style args (log.info("[MVA] %s loaded", mva)), never f-strings:
+# the message is only built if a handler actually emits the record.
 log = logging.getLogger("mc.automation")
-log.setLevel(getattr(logging, log_level))
+log.setLevel(_LEVELS.get(log_level, logging.INFO))  # unknown names fall back to INFO
 
 # Attach handler/formatter only once
 if not log.handlers:
@@ -34,9 +67,29 @@ if not log.handlers:
     handler.setFormatter(formatter)
     log.addHandler(handler)
 
-    # Add a file handler to write logs to a file
+    # Add a file handler to write logs to a file. Writes happen on a background
+    # listener thread; the logging caller only enqueues the record.
     file_handler = logging.FileHandler('automation.log', encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
+    file_formatter = CachedTimeFormatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
     file_handler.setFormatter(file_formatter)
-    log.addHandler(file_handler)
\ No newline at end of file
+
+    # Coalesce file writes; WARNING and above flush immediately, and the buffer is
+    # kept small so a hard-killed run (e.g. a hung Selenium call) loses little
+    buffered_file_handler = MemoryHandler(
+        capacity=int(get_config('logging.buffer_capacity', 50)),
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
+    atexit.register(buffered_file_handler.flush)
+
+    _log_queue = queue.SimpleQueue()
+    _LISTENER = QueueListener(_log_queue, buffered_file_handler, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)  # drains the queue before exit (runs before the flush)
+
+    queue_handler = QueueHandler(_log_queue)
+    queue_handler.setLevel(logging.DEBUG)
+    log.addHandler(queue_handler)
\ No newline at end of file
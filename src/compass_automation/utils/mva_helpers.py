@@ -5,13 +5,22 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from compass_automation.utils.logger import log
 
+_VEHICLE_VALUE_LOCATOR = (By.CLASS_NAME, "fleet-operations-pwa__vehicle-property-value__nwt5x3")
+_ADD_NEW_COMPLAINT_LOCATOR = (By.XPATH, "//button[contains(., 'Add New Complaint')]")
+_COMPLAINT_ITEM_LOCATOR = (By.CLASS_NAME, "fleet-operations-pwa__complaintItem__153vo4c")
+# arguments[0]: complaint tiles; returns each tile's content innerText (or null), index-aligned
+_TILE_CONTENTS_JS = """
+return arguments[0].map(t => {
+    const c = t.querySelector('.fleet-operations-pwa__tileContent__153vo4c');
+    return c ? c.innerText : null;
+});
+"""
+
 
 def wait_for_mva_match(driver, mva, timeout=30):
     """Waits for the MVA details to appear on the page, confirming successful lookup."""
     WebDriverWait(driver, timeout).until(
-        EC.text_to_be_present_in_element(
-            (By.CLASS_NAME, "fleet-operations-pwa__vehicle-property-value__nwt5x3"), mva
-        )
+        EC.text_to_be_present_in_element(_VEHICLE_VALUE_LOCATOR, mva)
     )
 
 
@@ -19,15 +28,13 @@ def click_add_new_complaint_button(driver, timeout=15):
     """Clicks the 'Add New Complaint' button if visible."""
     try:
         Btn = WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable(
-                (By.XPATH, "//button[contains(., 'Add New Complaint')]")
-            )
+            EC.element_to_be_clickable(_ADD_NEW_COMPLAINT_LOCATOR)
         )
-        print("Found 'Add New Complaint' button, clicking it...")
+        log.info("[COMPLAINT] Found 'Add New Complaint' button, clicking it...")
         Btn.click()
-        print("[DEBUG] Clicked 'Add New Complaint' button.")
+        log.debug("[COMPLAINT] Clicked 'Add New Complaint' button.")
     except TimeoutException:
-        print("[ERROR] 'Add New Complaint' button not found or not clickable.")
+        log.error("[COMPLAINT][ERROR] 'Add New Complaint' button not found or not clickable.")
         raise
 
 
@@ -35,28 +42,24 @@ def select_pm_complaint(driver, timeout=30):
     """Selects the first complaint tile containing 'PM'. Returns True if selected, else False."""
     try:
         WebDriverWait(driver, timeout).until(
-            EC.presence_of_all_elements_located(
-                (By.CLASS_NAME, "fleet-operations-pwa__complaintItem__153vo4c")
-            )
+            EC.presence_of_all_elements_located(_COMPLAINT_ITEM_LOCATOR)
         )
     except TimeoutException:
-        print("[DEBUG] No complaint tiles found within timeout.")
+        log.debug("[COMPLAINT] No complaint tiles found within timeout.")
         return False
 
-    complaint_tiles = driver.find_elements(
-        By.CLASS_NAME, "fleet-operations-pwa__complaintItem__153vo4c"
-    )
-    for tile in complaint_tiles:
+    complaint_tiles = driver.find_elements(*_COMPLAINT_ITEM_LOCATOR)
+    # One round trip for every tile's content text (null where a tile has none)
+    contents = driver.execute_script(_TILE_CONTENTS_JS, complaint_tiles)
+    for tile, content in zip(complaint_tiles, contents):
+        if content is None or "PM" not in content:
+            continue
         try:
-            content = tile.find_element(
-                By.CLASS_NAME, "fleet-operations-pwa__tileContent__153vo4c"
-            ).text
-            if "PM" in content:
-                tile.click()
-                log.info(f"Selected complaint with type: {content}")
-                return True
+            tile.click()
+            log.info("Selected complaint with type: %s", content)
+            return True
         except Exception as e:
-            log.info(f"[DEBUG] Skipped a tile due to error: {e}")
+            log.info("[DEBUG] Skipped a tile due to error: %s", e)
 
-    print("No 'PM' complaint found.")
+    log.info("[COMPLAINT] No 'PM' complaint found.")
     return False
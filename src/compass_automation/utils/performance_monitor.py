@@ -10,21 +10,84 @@ and system resource usage.
 import time
 import psutil
 import functools
+import itertools
 import threading
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import math
 import statistics
+from array import array
+from contextlib import contextmanager
 
+try:
+    import orjson  # optional C JSON encoder - much faster benchmark saves
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# One handle for this process; psutil.Process() construction is not free
+_PROC = psutil.Process()
+_MB = 1.0 / 1048576  # bytes -> MB
+_RESOURCE_SAMPLES = 1000  # newest resource samples kept (and saved in benchmarks)
+_CPU_SAMPLE_EVERY = 5  # read /proc CPU times on every Nth resource sample only
+
+
+def _rss_mb() -> float:
+    """Resident set size of this process in MB."""
+    return _PROC.memory_info().rss * _MB
+
+
+class _ResourceSamples:
+    """Fixed-size ring of resource samples stored as parallel typed arrays."""
+    
+    __slots__ = ("timestamp", "memory_mb", "cpu_percent", "threads", "_next", "_size")
+    
+    def __init__(self, capacity: int = _RESOURCE_SAMPLES):
+        self.timestamp = array('d', bytes(8 * capacity))
+        self.memory_mb = array('d', bytes(8 * capacity))
+        self.cpu_percent = array('d', bytes(8 * capacity))
+        self.threads = array('q', bytes(8 * capacity))
+        self._next = 0  # slot the next sample overwrites
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, timestamp: float, memory_mb: float, cpu_percent: float, threads: int):
+        i = self._next
+        self.timestamp[i] = timestamp
+        self.memory_mb[i] = memory_mb
+        self.cpu_percent[i] = cpu_percent
+        self.threads[i] = threads
+        capacity = len(self.timestamp)
+        self._next = (i + 1) % capacity
+        if self._size < capacity:
+            self._size += 1
+    
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Samples oldest-first, in the dict shape benchmark files use."""
+        capacity = len(self.timestamp)
+        start = (self._next - self._size) % capacity
+        return [
+            {
+                'timestamp': self.timestamp[j],
+                'memory_mb': self.memory_mb[j],
+                'cpu_percent': self.cpu_percent[j],
+                'threads': self.threads[j],
+            }
+            for j in ((start + k) % capacity for k in range(self._size))
+        ]
+
+
+@dataclass(slots=True)
 class PerformanceMetric:
     """Single performance measurement."""
     name: str
-    start_time: float
-    end_time: Optional[float] = None
+    start_time: int  # time.perf_counter_ns()
+    end_time: Optional[int] = None
     duration: Optional[float] = None
     memory_start: Optional[float] = None
     memory_end: Optional[float] = None
@@ -35,12 +98,13 @@ class PerformanceMetric:
     def finish(self):
         """Mark the metric as finished and calculate duration."""
         if self.end_time is None:
-            self.end_time = time.perf_counter()
-            self.duration = self.end_time - self.start_time
-            self.memory_end = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+            self.end_time = time.perf_counter_ns()
+            # Exact integer difference; converted to seconds once
+            self.duration = (self.end_time - self.start_time) * 1e-9
+            self.memory_end = _rss_mb()
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceSummary:
     """Summary of performance metrics."""
     total_duration: float
@@ -65,16 +129,44 @@ class PerformanceMonitor:
     - CPU utilization monitoring
     - Resource usage profiling
     - Benchmark comparison
+    
+    With retain_details=False only running totals are kept: memory stays
+    bounded, but get_summary cannot filter by name and save_benchmark
+    records no per-metric rows.
     """
     
-    def __init__(self):
+    def __init__(self, retain_details: bool = True):
+        self.retain_details = retain_details
         self.metrics: List[PerformanceMetric] = []
-        self.active_metrics: Dict[str, PerformanceMetric] = {}
+        self.active_metrics: Dict[int, PerformanceMetric] = {}
+        # Metric ids are plain ints from a counter: cheap to hash, and overlapping
+        # metrics with the same name never collide; next() is atomic under the GIL
+        self._ids = itertools.count()
+        # Held while updating/reading self.metrics and the running totals together
+        self._metrics_lock = threading.Lock()
+        self._reset_totals()
         self._monitoring = False
         self._resource_thread = None
-        self._resource_data = []
+        self._reset_resource_data()
+    
+    def _reset_totals(self):
+        """Reset the running aggregates behind the unfiltered summary."""
+        self._count = 0
+        self._duration_count = 0
+        self._duration_sum = 0.0
+        self._duration_min = math.inf
+        self._duration_max = -math.inf
+        self._memory_count = 0
+        self._memory_sum = 0.0
+    
+    def _reset_resource_data(self):
+        """Empty the sample ring and the whole-run peak/CPU totals."""
+        self._resource_data = _ResourceSamples()
+        self._memory_peak = 0
+        self._cpu_sum = 0.0
+        self._cpu_samples = 0
     
-    def start_metric(self, name: str, metadata: Dict[str, Any] = None) -> str:
+    def start_metric(self, name: str, metadata: Dict[str, Any] = None) -> int:
         """
         Start measuring a performance metric.
         
@@ -83,21 +175,21 @@ class PerformanceMonitor:
             metadata: Additional context information
             
         Returns:
-            str: Metric ID for later reference
+            int: Opaque metric ID for later reference
         """
-        metric_id = f"{name}_{len(self.metrics)}"
+        metric_id = next(self._ids)
         
         metric = PerformanceMetric(
             name=name,
-            start_time=time.perf_counter(),
-            memory_start=psutil.Process().memory_info().rss / 1024 / 1024,  # MB
-            metadata=metadata or {}
+            start_time=time.perf_counter_ns(),
+            memory_start=_rss_mb(),
+            metadata=dict(metadata) if metadata else {}  # own copy; error notes are added per metric
         )
         
         self.active_metrics[metric_id] = metric
         return metric_id
     
-    def end_metric(self, metric_id: str) -> PerformanceMetric:
+    def end_metric(self, metric_id: int) -> PerformanceMetric:
         """
         Finish measuring a performance metric.
         
@@ -113,13 +205,21 @@ class PerformanceMonitor:
         metric = self.active_metrics.pop(metric_id)
         metric.finish()
         
-        # Add CPU usage if available
-        try:
-            metric.cpu_percent = psutil.cpu_percent()
-        except:
-            pass
-        
-        self.metrics.append(metric)
+        duration, memory_end = metric.duration, metric.memory_end
+        with self._metrics_lock:
+            self._count += 1
+            if duration is not None:
+                self._duration_count += 1
+                self._duration_sum += duration
+                if duration < self._duration_min:
+                    self._duration_min = duration
+                if duration > self._duration_max:
+                    self._duration_max = duration
+            if memory_end is not None:
+                self._memory_count += 1
+                self._memory_sum += memory_end
+            if self.retain_details:
+                self.metrics.append(metric)
         return metric
     
     def measure_function(self, func_name: str = None, metadata: Dict[str, Any] = None):
@@ -142,16 +242,13 @@ class PerformanceMonitor:
                 metric_id = self.start_metric(name, metadata)
                 
                 try:
-                    result = func(*args, **kwargs)
-                    return result
+                    return func(*args, **kwargs)
                 except Exception as e:
                     # Still record the metric even if function failed
-                    metric = self.end_metric(metric_id)
-                    metric.metadata['error'] = str(e)
+                    self.active_metrics[metric_id].metadata['error'] = str(e)
                     raise
-                else:
+                finally:
                     self.end_metric(metric_id)
-                    return result
             
             return wrapper
         return decorator
@@ -167,20 +264,32 @@ class PerformanceMonitor:
             return
         
         self._monitoring = True
-        self._resource_data = []
+        self._reset_resource_data()
         
         def monitor_resources():
-            process = psutil.Process()
-            while self._monitoring:
+            process = _PROC
+            cpu_percent = 0.0
+            for sample in itertools.count():
+                if not self._monitoring:
+                    break
                 try:
-                    self._resource_data.append({
-                        'timestamp': time.time(),
-                        'memory_mb': process.memory_info().rss / 1024 / 1024,
-                        'cpu_percent': process.cpu_percent(),
-                        'threads': process.num_threads()
-                    })
+                    memory_mb = process.memory_info().rss * _MB
+                    # cpu_percent() measures since its previous call, so a sparser
+                    # reading still covers the whole interval; reuse it in between
+                    fresh_cpu = sample % _CPU_SAMPLE_EVERY == 0
+                    if fresh_cpu:
+                        cpu_percent = process.cpu_percent()
+                    self._resource_data.append(
+                        time.time(), memory_mb, cpu_percent, process.num_threads()
+                    )
+                    # The ring drops old samples, so whole-run figures are kept here
+                    if memory_mb > self._memory_peak:
+                        self._memory_peak = memory_mb
+                    if fresh_cpu:
+                        self._cpu_sum += cpu_percent
+                        self._cpu_samples += 1
                     time.sleep(interval)
-                except:
+                except (psutil.Error, OSError):  # includes NoSuchProcess/AccessDenied
                     break
         
         self._resource_thread = threading.Thread(target=monitor_resources, daemon=True)
@@ -197,16 +306,39 @@ class PerformanceMonitor:
         Get performance summary for completed metrics.
         
         Args:
-            name_filter: Filter metrics by name (substring match)
+            name_filter: Filter metrics by name (substring match); needs
+                retain_details
             
         Returns:
             PerformanceSummary: Aggregated performance data
         """
-        filtered_metrics = self.metrics
-        if name_filter:
-            filtered_metrics = [m for m in self.metrics if name_filter in m.name]
+        if name_filter and not self.retain_details:
+            raise ValueError("name_filter requires a monitor created with retain_details=True")
         
-        if not filtered_metrics:
+        with self._metrics_lock:
+            if name_filter:
+                selected = [m for m in self.metrics if name_filter in m.name]
+                operation_count = len(selected)
+                durations = [m.duration for m in selected if m.duration is not None]
+                memory_usage = [m.memory_end for m in selected if m.memory_end is not None]
+                # Float-only reductions: fsum/fmean avoid statistics.mean's exact
+                # (Fraction-based) arithmetic, and the average reuses the total
+                total_duration = math.fsum(durations)
+                average_duration = total_duration / len(durations) if durations else 0
+                min_duration = min(durations) if durations else 0
+                max_duration = max(durations) if durations else 0
+                memory_usage_mb = statistics.fmean(memory_usage) if memory_usage else 0
+            else:
+                # Unfiltered: read the running totals, O(1) in the number of metrics
+                operation_count = self._count
+                total_duration = self._duration_sum
+                n = self._duration_count
+                average_duration = total_duration / n if n else 0
+                min_duration = self._duration_min if n else 0
+                max_duration = self._duration_max if n else 0
+                memory_usage_mb = self._memory_sum / self._memory_count if self._memory_count else 0
+        
+        if not operation_count:
             return PerformanceSummary(
                 total_duration=0,
                 average_duration=0,
@@ -219,24 +351,18 @@ class PerformanceMonitor:
                 timestamp=datetime.now().isoformat()
             )
         
-        durations = [m.duration for m in filtered_metrics if m.duration is not None]
-        memory_usage = [m.memory_end for m in filtered_metrics if m.memory_end is not None]
-        cpu_usage = [m.cpu_percent for m in filtered_metrics if m.cpu_percent is not None]
-        
-        # Resource monitoring peaks
-        memory_peak = 0
-        if self._resource_data:
-            memory_peak = max(d['memory_mb'] for d in self._resource_data)
+        # Resource monitoring peaks; CPU comes only from the background sampler
+        cpu_samples = self._cpu_samples
         
         return PerformanceSummary(
-            total_duration=sum(durations),
-            average_duration=statistics.mean(durations) if durations else 0,
-            min_duration=min(durations) if durations else 0,
-            max_duration=max(durations) if durations else 0,
-            memory_usage_mb=statistics.mean(memory_usage) if memory_usage else 0,
-            memory_peak_mb=memory_peak,
-            cpu_average=statistics.mean(cpu_usage) if cpu_usage else 0,
-            operation_count=len(filtered_metrics),
+            total_duration=total_duration,
+            average_duration=average_duration,
+            min_duration=min_duration,
+            max_duration=max_duration,
+            memory_usage_mb=memory_usage_mb,
+            memory_peak_mb=self._memory_peak,
+            cpu_average=self._cpu_sum / cpu_samples if cpu_samples else 0,
+            operation_count=operation_count,
             timestamp=datetime.now().isoformat()
         )
     
@@ -277,12 +403,16 @@ class PerformanceMonitor:
                 }
                 for m in self.metrics
             ],
-            'resource_data': self._resource_data[-1000:] if self._resource_data else []  # Last 1000 samples
+            'resource_data': self._resource_data.to_list()  # newest _RESOURCE_SAMPLES samples
         }
         
         benchmark_file = benchmark_dir / f"{filename}.json"
-        with open(benchmark_file, 'w') as f:
-            json.dump(benchmark_data, f, indent=2)
+        if orjson is not None:
+            with open(benchmark_file, 'wb') as f:
+                f.write(orjson.dumps(benchmark_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(benchmark_file, 'w') as f:
+                json.dump(benchmark_data, f, indent=2)
         
         print(f"✅ Benchmark saved: {benchmark_file}")
         return benchmark_file
@@ -347,9 +477,11 @@ class PerformanceMonitor:
     
     def clear_metrics(self):
         """Clear all collected metrics."""
-        self.metrics.clear()
+        with self._metrics_lock:
+            self.metrics.clear()
+            self._reset_totals()
         self.active_metrics.clear()
-        self._resource_data.clear()
+        self._reset_resource_data()
     
     def print_summary(self, name_filter: str = None):
         """Print a formatted performance summary."""
@@ -379,6 +511,7 @@ def measure_performance(name: str = None, metadata: Dict[str, Any] = None):
     return performance_monitor.measure_function(name, metadata)
 
 
+@contextmanager
 def benchmark_test_suite(test_name: str):
     """
     Context manager for benchmarking entire test suites.
@@ -388,31 +521,22 @@ def benchmark_test_suite(test_name: str):
             # Run tests
             pass
     """
-    class TestSuiteBenchmark:
-        def __init__(self, name: str):
-            self.name = name
-            self.metric_id = None
-        
-        def __enter__(self):
-            performance_monitor.start_resource_monitoring()
-            self.metric_id = performance_monitor.start_metric(
-                f"test_suite_{self.name}",
-                {"suite_name": self.name}
-            )
-            return self
-        
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            performance_monitor.end_metric(self.metric_id)
-            performance_monitor.stop_resource_monitoring()
-            
-            if exc_type is None:
-                # Tests passed, save benchmark
-                performance_monitor.save_benchmark(
-                    f"test_suite_{self.name}",
-                    f"Benchmark for {self.name} test suite"
-                )
+    performance_monitor.start_resource_monitoring()
+    metric_id = performance_monitor.start_metric(
+        f"test_suite_{test_name}",
+        {"suite_name": test_name}
+    )
+    try:
+        yield
+    finally:
+        performance_monitor.end_metric(metric_id)
+        performance_monitor.stop_resource_monitoring()
     
-    return TestSuiteBenchmark(test_name)
+    # Tests passed, save benchmark
+    performance_monitor.save_benchmark(
+        f"test_suite_{test_name}",
+        f"Benchmark for {test_name} test suite"
+    )
 
 
 if __name__ == "__main__":
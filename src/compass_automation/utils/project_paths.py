@@ -8,11 +8,15 @@ import os
 from pathlib import Path
 from typing import Union
 
+# This file is in src/compass_automation/utils/, so project root is three levels up.
+# Resolved once at import so get_project_root never touches the filesystem.
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
 
 class ProjectPaths:
     """Central utility for managing project file paths."""
     
-    _project_root = None
+    _dir_cache = {}  # parts -> Path under the project root
     
     @classmethod
     def get_project_root(cls) -> Path:
@@ -22,10 +26,15 @@ class ProjectPaths:
         Returns:
             Path: Absolute path to project root (directory containing this file's parent's parent)
         """
-        if cls._project_root is None:
-            # This file is in src/compass_automation/utils/, so project root is three levels up
-            cls._project_root = Path(__file__).parent.parent.parent.parent.resolve()
-        return cls._project_root
+        return _PROJECT_ROOT
+    
+    @classmethod
+    def _project_dir(cls, *parts: str) -> Path:
+        """Return a root-relative directory, building the Path only once."""
+        path = cls._dir_cache.get(parts)
+        if path is None:
+            path = cls._dir_cache[parts] = _PROJECT_ROOT.joinpath(*parts)
+        return path
     
     @classmethod
     def get_config_path(cls, filename: str = "config.json") -> Path:
@@ -38,7 +47,7 @@ class ProjectPaths:
         Returns:
             Path: Absolute path to the config file
         """
-        return cls.get_project_root() / "src" / "compass_automation" / "config" / filename
+        return cls._project_dir("src", "compass_automation", "config") / filename
     
     @classmethod
     def get_data_path(cls, filename: str = None) -> Path:
@@ -51,7 +60,7 @@ class ProjectPaths:
         Returns:
             Path: Absolute path to data file or data directory if filename is None
         """
-        data_dir = cls.get_project_root() / "data"
+        data_dir = cls._project_dir("data")
         if filename:
             return data_dir / filename
         return data_dir
@@ -67,7 +76,7 @@ class ProjectPaths:
         Returns:
             Path: Absolute path to log file or logs directory if filename is None
         """
-        logs_dir = cls.get_project_root() / "logs"
+        logs_dir = cls._project_dir("logs")
         if filename:
             return logs_dir / filename
         return logs_dir
@@ -83,7 +92,7 @@ class ProjectPaths:
         Returns:
             Path: Absolute path to screenshot file or screenshots directory if filename is None
         """
-        screenshots_dir = cls.get_project_root() / "screenshots"
+        screenshots_dir = cls._project_dir("screenshots")
         if filename:
             return screenshots_dir / filename
         return screenshots_dir
@@ -1,4 +1,5 @@
 # utils/ui_helpers.py
+import logging
 import os
 import time
 from typing import Optional
@@ -7,35 +8,57 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from compass_automation.utils.logger import log
+from compass_automation.utils.xpath import xpath_literal  # re-exported for existing callers
+
+
+_FAST_POLL = 0.1  # seconds between polls when waiting out short UI transitions
+
+
+def _wait(driver, timeout) -> WebDriverWait:
+    """Shared fast-polling WebDriverWait for driver, one per timeout (cached on the driver)."""
+    cache = driver.__dict__.setdefault("_wait_cache", {})
+    w = cache.get(timeout)
+    if w is None:
+        w = cache[timeout] = WebDriverWait(driver, timeout, poll_frequency=_FAST_POLL)
+    return w
 
 
 def safe_wait(driver, timeout, condition, desc="condition"):
     """Wait safely for a condition; return element/value or None on timeout."""
     try:
-        return WebDriverWait(driver, timeout).until(condition)
+        return _wait(driver, timeout).until(condition)
     except TimeoutException:
         msg = f"[SAFE_WAIT] Timeout while waiting for {desc}"
         # For now: all waits are required, so fail
         raise AssertionError(msg)
 
 
+def settle(driver, condition, max_wait: float = 0.3) -> bool:
+    """Wait up to max_wait for a post-click condition; True as soon as it holds, False on timeout."""
+    try:
+        WebDriverWait(driver, max_wait, poll_frequency=_FAST_POLL).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+# The tab element once no modal overlay is showing and the tab is rendered and not
+# aria-disabled, else null. arguments[0]: data-tab-id
+_TAB_READY_JS = """
+const shown = el => !!el && el.getClientRects().length > 0;
+if (shown(document.querySelector(".bp6-dialog[aria-modal='true']"))) return null;
+const tab = document.querySelector('div.bp6-tab[data-tab-id="' + CSS.escape(arguments[0]) + '"]');
+return shown(tab) && tab.getAttribute('aria-disabled') !== 'true' ? tab : null;
+"""
 
-def _click_tab(driver, data_tab_id: str, timeout: int = 10) -> bool:
-    # Guard: any modal overlay gone
-    WebDriverWait(driver, timeout).until(
-        EC.invisibility_of_element_located(
-            (By.CSS_SELECTOR, ".bp6-dialog[aria-modal='true']")
-        )
-    )
 
-    # Find the tab by stable attribute
+def _click_tab(driver, data_tab_id: str, timeout: int = 10) -> bool:
+    # Guard: any modal overlay gone, and the tab (by stable attribute) clickable -
+    # both checked from one DOM snapshot per poll
     tab = WebDriverWait(driver, timeout).until(
-        EC.element_to_be_clickable(
-            (By.CSS_SELECTOR, f"div.bp6-tab[data-tab-id='{data_tab_id}']")
-        )
+        lambda d: d.execute_script(_TAB_READY_JS, data_tab_id)
     )
     driver.execute_script("arguments[0].scrollIntoView({block:'center'});", tab)
-    time.sleep(0.2)
     tab.click()
 
     # Verify it took (aria-selected flips to true)
@@ -55,7 +78,7 @@ def click_work_items(driver, timeout: int = 10) -> bool:
 
 
 def click_complaints(driver, timeout: int = 10) -> bool:
-    log.info(f"[TAB] Attempting to click Complaints tab (timeout={timeout}s)")
+    log.info("[TAB] Attempting to click Complaints tab (timeout=%ss)", timeout)
     result = _click_tab(driver, "complaints", timeout)
     if result:
         print("[TAB] Complaints tab clicked and verified as active")
@@ -92,7 +115,7 @@ def send_text(
             EC.element_to_be_clickable(locator)
         )
     except TimeoutException:
-        log.warning(f"[SENDTEXT] {label or locator} not found within {timeout}s")
+        log.warning("[SENDTEXT] %s not found within %ss", label or locator, timeout)
         return False
 
     try:
@@ -104,55 +127,49 @@ def send_text(
         typed_value = element.get_attribute("value")
         if typed_value != text:
             log.warning(
-                f"[SENDTEXT] {label or locator} mismatch -> expected '{text}', got '{typed_value}'"
+                "[SENDTEXT] %s mismatch -> expected '%s', got '%s'", label or locator, text, typed_value
             )
             return False
 
-        log.info(f"[SENDTEXT] Sent text to {label or locator}")
+        log.info("[SENDTEXT] Sent text to %s", label or locator)
         return True
 
     except Exception as e:
-        log.error(f"[SENDTEXT] Exception sending text to {label or locator}: {e}")
+        log.error("[SENDTEXT] Exception sending text to %s: %s", label or locator, e)
         return False
 
 
+_COMPLAINTS_PANEL_CSS = "div.bp6-tab-panel[id*='complaints'][aria-hidden='false']"
+_WORKITEMS_PANEL_CSS = "div.bp6-tab-panel[id*='workItems'][aria-hidden='false']"
+
+# Tile, state and type selectors passed to _SCRAPE_TILES_JS, per panel
+_COMPLAINT_TILE_CSS = (
+    "div[class*='fleet-operations-pwa__complaint-record__']",
+    "div.fleet-operations-pwa__complaint-status__1yyobh2 div",
+    "div.fleet-operations-pwa__scan-record-header-title__1yyobh2",
+)
+_WORKITEM_TILE_CSS = (
+    "div[class*='scan-record__'][class*='bp6-card']",
+    "div[class*='scan-record-header-title-right__']",
+    "div[class*='scan-record-header-title__']",
+)
+
+# Read every tile's state and type in one round trip.
+# arguments: panel element, tile CSS, state CSS, type CSS; returns [{state, type}]
+_SCRAPE_TILES_JS = """
+const [panel, tileCss, stateCss, typeCss] = arguments;
+const text = (tile, css) => { const el = tile.querySelector(css); return el ? el.innerText.trim() : ''; };
+return Array.from(panel.querySelectorAll(tileCss), t => ({state: text(t, stateCss), type: text(t, typeCss)}));
+"""
+
+
 def get_complaints(driver, timeout: int = 10):
     """Return list of {'state': 'Open'|'Closed', 'type': 'PM'|...} from the visible Complaints tab."""
-    WebDriverWait(driver, timeout).until(
-        EC.presence_of_element_located(
-            (
-                By.CSS_SELECTOR,
-                "div.bp6-tab-panel[id*='complaints'][aria-hidden='false']",
-            )
-        )
-    )
-    panel = driver.find_element(
-        By.CSS_SELECTOR, "div.bp6-tab-panel[id*='complaints'][aria-hidden='false']"
+    panel = WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, _COMPLAINTS_PANEL_CSS))
     )
-    tiles = panel.find_elements(
-        By.CSS_SELECTOR, "div[class*='fleet-operations-pwa__complaint-record__']"
-    )
-
-    items = []
-    for t in tiles:
-        state = ""
-        ctype = ""
-        try:
-            state = t.find_element(
-                By.CSS_SELECTOR,
-                "div.fleet-operations-pwa__complaint-status__1yyobh2 div",
-            ).text.strip()
-        except Exception:
-            pass
-        try:
-            ctype = t.find_element(
-                By.CSS_SELECTOR,
-                "div.fleet-operations-pwa__scan-record-header-title__1yyobh2",
-            ).text.strip()
-        except Exception:
-            pass
-        items.append({"state": state, "type": ctype})
-    log.info(f"[COMPLAINTS] collected {len(items)} item(s)")
+    items = driver.execute_script(_SCRAPE_TILES_JS, panel, *_COMPLAINT_TILE_CSS) or []
+    log.info("[COMPLAINTS] collected %s item(s)", len(items))
     return items
 
 
@@ -160,82 +177,102 @@ def has_open_of_type(items, ctype: str) -> bool:
     return any(it.get("state") == "Open" and it.get("type") == ctype for it in items)
 
 
+# div.bp6-dialog is already matched by the substring selector
+_DIALOG_CSS = "div[class*='dialog']"
+
+
 def find_dialog(driver):
     """Return the current Compass dialog element, if present."""
-    return driver.find_element(By.CSS_SELECTOR, "div.bp6-dialog, div[class*='dialog']")
+    return driver.find_element(By.CSS_SELECTOR, _DIALOG_CSS)
 
 
 
 def find_elements(driver, locator, timeout=10):
     """Wait for one or more elements to appear and return them."""
-    return WebDriverWait(driver, timeout).until(
+    return _wait(driver, timeout).until(
         EC.presence_of_all_elements_located(locator)
     )
 
 
 def get_text(driver, xpath: str, timeout: int = 6) -> str:
-    el = WebDriverWait(driver, timeout).until(
+    el = _wait(driver, timeout).until(
         EC.presence_of_element_located((By.XPATH, xpath))
     )
     return el.text.strip()
 
 
+# 'Created At' row of the first work item / complaint mentioning {complaint}
+_WORKITEM_CREATED_XP = (
+    "(//div[contains(@class,'scan-record-row-2')]"
+    "[.//div[strong[normalize-space()='Complaints']][contains(normalize-space(),'{complaint}')]]"
+    "//div[strong[normalize-space()='Created At']])[1]"
+)
+_COMPLAINT_CREATED_XP = (
+    "(//div[contains(@class,'complaintItem') or contains(@class,'complaint')]"
+    "[.//*[contains(normalize-space(),'{complaint}')]]"
+    "//div[strong[normalize-space()='Created At']])[1]"
+)
+
+
 def get_create_date_workitem(driver, complaint: str = "PM", timeout: int = 6) -> str:
-    xp = (
-        "(//div[contains(@class,'scan-record-row-2')]"
-        f"[.//div[strong[normalize-space()='Complaints']][contains(normalize-space(),'{complaint}')]]"
-        "//div[strong[normalize-space()='Created At']])[1]"
-    )
-    txt = get_text(driver, xp, timeout)
+    txt = get_text(driver, _WORKITEM_CREATED_XP.format(complaint=complaint), timeout)
     return txt.replace("Created At", "").lstrip(": ").strip()
 
 
 def get_create_date_complaint(driver, complaint: str = "PM", timeout: int = 6) -> str:
-    xp = (
-        "(//div[contains(@class,'complaintItem') or contains(@class,'complaint')]"
-        f"[.//*[contains(normalize-space(),'{complaint}')]]"
-        "//div[strong[normalize-space()='Created At']])[1]"
-    )
-    txt = get_text(driver, xp, timeout)
+    txt = get_text(driver, _COMPLAINT_CREATED_XP.format(complaint=complaint), timeout)
     return txt.replace("Created At", "").lstrip(": ").strip()
 
 
+class _tile_count_stable:
+    """Wait condition: the number of tiles matching css is unchanged for min_stable_ms."""
+
+    def __init__(self, css: str, min_stable_ms: int):
+        self.css = css
+        self.min_stable = min_stable_ms / 1000
+        self.count = None
+        self.since = 0.0
+
+    def __call__(self, driver):
+        count = len(driver.find_elements(By.CSS_SELECTOR, self.css))
+        now = time.monotonic()
+        if count != self.count:
+            self.count, self.since = count, now
+            return False
+        return now - self.since >= self.min_stable
+
+
+def wait_for_tiles_stable(driver, css: str, min_stable_ms: int = 500, timeout: int = 8) -> int:
+    """Poll the tile count until it stops changing, then return it (last count on timeout)."""
+    cond = _tile_count_stable(css, min_stable_ms)
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(cond)
+    except TimeoutException:
+        log.debug("[TILES] count for %s still changing after %ss", css, timeout)
+    return cond.count or 0
+
+
 def has_open_workitems_of_type(items, itype: str) -> bool:
-    time.sleep(5)  # Allow any async updates to settle
     return any(it.get("state") == "Open" and it.get("type") == itype for it in items)
 
 
 def debug_list_work_items(driver, timeout: int = 10):
+    # Output-only helper: skip the waits and the scrape when nothing would be logged
+    if not log.isEnabledFor(logging.INFO):
+        return
+
     # Ensure Work Items panel is visible
-    WebDriverWait(driver, timeout).until(
-        EC.presence_of_element_located(
-            (By.CSS_SELECTOR, "div.bp6-tab-panel[id*='workItems'][aria-hidden='false']")
-        )
-    )
-    panel = driver.find_elements(
-        By.CSS_SELECTOR, "div.bp6-tab-panel[id*='workItems'][aria-hidden='false']"
+    panel = WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, _WORKITEMS_PANEL_CSS))
     )
 
-    # One tile = scan-record card
-    tiles = panel.find_elements(
-        By.CSS_SELECTOR, "div[class*='scan-record__'][class*='bp6-card']"
-    )
-    log.info(f"[WORKITEMS][DBG] tiles={len(tiles)}")
+    # One tile = scan-record card; let async loads finish before reading them
+    wait_for_tiles_stable(driver, f"{_WORKITEMS_PANEL_CSS} {_WORKITEM_TILE_CSS[0]}", timeout=timeout)
+    items = driver.execute_script(_SCRAPE_TILES_JS, panel, *_WORKITEM_TILE_CSS) or []
+    log.info("[WORKITEMS][DBG] tiles=%s", len(items))
 
-    for i, t in enumerate(tiles, 1):
-        try:
-            wtype = t.find_element(
-                By.CSS_SELECTOR, "div[class*='scan-record-header-title__']"
-            ).text.strip()
-        except Exception:
-            wtype = ""
-        try:
-            state = t.find_element(
-                By.CSS_SELECTOR, "div[class*='scan-record-header-title-right__']"
-            ).text.strip()
-        except Exception:
-            state = ""
-        log.info(f"  - #{i} type='{wtype}' state='{state}'")
+    for i, it in enumerate(items, 1):
+        log.info("  - #%s type='%s' state='%s'", i, it["type"], it["state"])
 
 
  
@@ -253,105 +290,135 @@ def _dump_artifacts(driver, label: str):
             f.write(driver.page_source)
     except Exception as _:
         pass
-    log.debug(f"[ARTIFACT] saved {png} and {html}")
+    log.debug("[ARTIFACT] saved %s and %s", png, html)
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# Resolve 'known' once the vehicle properties panel echoes the MVA (MutationObserver,
+# no polling), or 'timeout'. arguments[0]: last 8 of the MVA, arguments[1]: timeout in ms.
+_AWAIT_MVA_JS = """
+const last8 = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+const probe = () => Array.from(document.querySelectorAll(
+    "div[class*='vehicle-properties-container'] div[class*='vehicle-property-value']"
+)).some(v => (v.textContent || '').includes(last8));
+if (probe()) return done('known');
+const obs = new MutationObserver(() => {
+    if (probe()) { obs.disconnect(); clearTimeout(timer); done('known'); }
+});
+obs.observe(document.body, {childList: true, subtree: true, characterData: true});
+const timer = setTimeout(() => { obs.disconnect(); done('timeout'); }, timeoutMs);
+"""
 
 def is_mva_known(driver, mva: str, timeout: int = 15) -> bool:
 
-    """Return True if vehicle-properties-container loads, else False (unknown MVA)."""
+    """Return True once the vehicle properties panel echoes the MVA, else False (unknown MVA)."""
 
-    log.info(f"[MVA] {mva} — checking if vehicle loads...")
+    log.info("[MVA] %s — checking if vehicle loads...", mva)
 
     try:
+        status = driver.execute_async_script(_AWAIT_MVA_JS, mva[-8:], timeout * 1000)
+    except WebDriverException as e:
+        log.warning("[MVA][WARN] %s — vehicle load check failed -> %s", mva, e)
+        return False
 
-        WebDriverWait(driver, timeout).until(
-
-            EC.presence_of_element_located(
-
-                (By.XPATH, "//div[contains(@class,'vehicle-properties-container')]")
-
-            )
-
-        )
-
-        log.debug(f"[MVA] {mva} — vehicle properties container detected")
-
+    if status == "known":
+        log.debug("[MVA] %s — vehicle properties container detected", mva)
         return True
 
-    except TimeoutException:
+    log.warning("[MVA][WARN] %s — vehicle properties container not found (likely unknown MVA)", mva)
+    return False
 
-        log.warning(f"[MVA][WARN] {mva} — vehicle properties container not found (likely unknown MVA)")
 
-        return False
 
 
 
+# 'Lighthouse' value div inside the vehicle properties container (label div, then value div)
+_LIGHTHOUSE_VALUE_LOC = (
+    By.XPATH,
+    "//div[contains(@class,'vehicle-properties-container__tniqjm')]"
+    "//div[contains(@class,'vehicle-property-name')][normalize-space()='Lighthouse']"
+    "/following-sibling::div[contains(@class,'vehicle-property-value')]",
+)
 
 
 def get_lighthouse_status(driver, mva: str, timeout: int = 8) -> Optional[str]:
-
     """
-
     Extracts the 'Lighthouse' status from the vehicle properties container.
-
     Assumes the structure is a label div followed by a value div.
-
     """
-
-    log.info(f"[MVA] {mva} — attempting to extract Lighthouse status...")
-
+    log.info("[MVA] %s — attempting to extract Lighthouse status...", mva)
     try:
-
-        # Locate the vehicle properties container
-
-        container = WebDriverWait(driver, timeout).until(
-
-            EC.presence_of_element_located(
-
-                (By.CSS_SELECTOR, "div.fleet-operations-pwa__vehicle-properties-container__tniqjm")
-
-            )
-
+        # One wait on the full container -> label -> value path
+        value_el = WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located(_LIGHTHOUSE_VALUE_LOC)
         )
-
-
-
-        # Within the container, find the 'Lighthouse' label and its corresponding value
-
-        lighthouse_label_xpath = ".//div[contains(@class,'vehicle-property-name')][normalize-space()='Lighthouse']"
-
-        lighthouse_value_xpath = f"{lighthouse_label_xpath}/following-sibling::div[contains(@class,'vehicle-property-value')]"
-
-
-
-        lighthouse_value_element = WebDriverWait(container, timeout).until(
-
-            EC.presence_of_element_located((By.XPATH, lighthouse_value_xpath))
-
-        )
-
-        status = lighthouse_value_element.text.strip()
-
-        log.info(f"[MVA] {mva} — Lighthouse status: {status}")
-
+        status = value_el.text.strip()
+        log.info("[MVA] %s — Lighthouse status: %s", mva, status)
         return status
-
     except TimeoutException:
-
-        log.warning(f"[MVA][WARN] {mva} — Lighthouse status element not found within timeout.")
-
+        log.warning("[MVA][WARN] %s — Lighthouse status element not found within timeout.", mva)
         return None
-
     except Exception as e:
+        log.error("[MVA][ERROR] %s — Failed to extract Lighthouse status: %s", mva, e)
+        return None
 
-        log.error(f"[MVA][ERROR] {mva} — Failed to extract Lighthouse status: {e}")
 
-        return None
+# Resolve {known, lighthouse} in one in-page wait (MutationObserver): returns as soon as the
+# MVA is echoed and its Lighthouse value is present, or graceMs after the echo if no
+# Lighthouse value shows up; on timeout, whatever was seen last.
+# arguments[0]: last 8 of the MVA, arguments[1]: timeout in ms, arguments[2]: grace in ms.
+_AWAIT_VEHICLE_JS = """
+const last8 = arguments[0], timeoutMs = arguments[1], graceMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const snapshot = () => {
+    const c = document.querySelector("div[class*='vehicle-properties-container']");
+    if (!c) return null;
+    const values = Array.from(c.querySelectorAll("div[class*='vehicle-property-value']"));
+    if (!values.some(v => (v.textContent || '').includes(last8))) return null;
+    const label = Array.from(c.querySelectorAll("div[class*='vehicle-property-name']"))
+        .find(n => (n.textContent || '').trim() === 'Lighthouse');
+    const value = label && label.nextElementSibling;
+    return {known: true, lighthouse: value ? value.innerText.trim() : null};
+};
+let last = null, grace = null, settled = false;
+const finish = r => {
+    if (settled) return;
+    settled = true; obs.disconnect(); clearTimeout(timer); clearTimeout(grace); done(r);
+};
+const check = () => {
+    last = snapshot() || last;
+    if (!last) return;
+    if (last.lighthouse !== null) finish(last);
+    else if (grace === null) grace = setTimeout(() => finish(last), graceMs);
+};
+const obs = new MutationObserver(check);
+obs.observe(document.body, {childList: true, subtree: true, characterData: true});
+const timer = setTimeout(() => finish(last || {known: false, lighthouse: null}), timeoutMs);
+check();
+"""
+
+
+def get_vehicle_snapshot(driver, mva: str, timeout: int = 15, lighthouse_grace: float = 2) -> dict:
+    """
+    Wait once for both the MVA echo and its Lighthouse status.
+    Returns {'known': bool, 'lighthouse': str | None}; the worst case is one timeout,
+    not is_mva_known's plus get_lighthouse_status's. A known vehicle without a
+    Lighthouse value costs at most lighthouse_grace seconds more than the echo.
+    """
+    log.info("[MVA] %s — checking if vehicle loads...", mva)
+    try:
+        snap = driver.execute_async_script(
+            _AWAIT_VEHICLE_JS, mva[-8:], timeout * 1000, int(lighthouse_grace * 1000)
+        )
+    except WebDriverException as e:
+        log.warning("[MVA][WARN] %s — vehicle snapshot failed -> %s", mva, e)
+        return {"known": False, "lighthouse": None}
 
+    log.info("[MVA] %s — known=%s, Lighthouse status: %s", mva, snap["known"], snap["lighthouse"])
+    return snap
 
 
 from selenium.common.exceptions import StaleElementReferenceException
@@ -378,29 +445,33 @@ def is_stale(element) -> bool:
 
 
 def click_element(driver, locator: tuple, desc: str = "element", timeout: int = 8) -> bool:
-    """Find and click an element with a single retry if stale."""
-    log.debug(f"[CLICK] attempting to click {locator} ({desc})")
+    """Find and click an element with a single retry if stale.
+
+    The Edge session uses page_load_strategy='eager' (driver_manager), so a click that
+    starts a navigation returns at DOMContentLoaded; wait for the target state explicitly.
+    """
+    log.debug("[CLICK] attempting to click %s (%s)", locator, desc)
     try:
         el = WebDriverWait(driver, timeout).until(
             EC.element_to_be_clickable(locator)
         )
         try:
             el.click()
-            log.debug(f"[CLICK] clicked {locator} ({desc})")
+            log.debug("[CLICK] clicked %s (%s)", locator, desc)
             return True
         except StaleElementReferenceException:
-            log.warning(f"[CLICK][WARN] stale element -> retrying {locator} ({desc})")
+            log.warning("[CLICK][WARN] stale element -> retrying %s (%s)", locator, desc)
             el = WebDriverWait(driver, timeout).until(
                 EC.element_to_be_clickable(locator)
             )
             el.click()
-            log.debug(f"[CLICK] clicked after retry {locator} ({desc})")
+            log.debug("[CLICK] clicked after retry %s (%s)", locator, desc)
             return True
     except TimeoutException:
-        log.warning(f"[CLICK][WARN] timeout waiting for {locator} ({desc})")
+        log.warning("[CLICK][WARN] timeout waiting for %s (%s)", locator, desc)
         return False
     except Exception as e:
-        log.exception(f"[CLICK][ERR] could not click {locator} ({desc})")
+        log.exception("[CLICK][ERR] could not click %s (%s)", locator, desc)
         return False
 
 
@@ -410,12 +481,21 @@ def click_element(driver, locator: tuple, desc: str = "element", timeout: int =
 
 def _is_selected_tile(tile) -> bool:
     try:
-        cls = tile.get_attribute("class") or ""
-        return "fleet-operations-pwa__selected__153vo4c" in cls
+        return bool(tile.parent.execute_script(
+            "return arguments[0].classList.contains('fleet-operations-pwa__selected__153vo4c');", tile
+        ))
     except Exception:
         return False
 
 
+# The opcode tile whose text cell reads 'PM Gas', in one query instead of a read per tile
+_PM_GAS_TILE_LOC = (
+    By.XPATH,
+    "//*[contains(@class,'fleet-operations-pwa__opCodeItem__153vo4c')]"
+    "[.//*[contains(@class,'fleet-operations-pwa__opCodeText__153vo4c')][normalize-space()='PM Gas']]",
+)
+
+
 def select_opcode_pm_gas(driver, timeout: int = 8) -> bool:
     """
     Select the 'PM Gas' opcode tile.
@@ -423,56 +503,50 @@ def select_opcode_pm_gas(driver, timeout: int = 8) -> bool:
     Text: .fleet-operations-pwa__opCodeText__153vo4c == 'PM Gas'
     """
     try:
-        WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, ".fleet-operations-pwa__opCodeItem__153vo4c")
-            )
+        t = WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located(_PM_GAS_TILE_LOC)
         )
-    except TimeoutException:
+        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", t)
+        t.click()
+    except Exception:
         return False
-    tiles = driver.find_elements(
-        By.CSS_SELECTOR, ".fleet-operations-pwa__opCodeItem__153vo4c"
-    )
-    for t in tiles:
-        try:
-            txt = t.find_element(
-                By.CSS_SELECTOR, ".fleet-operations-pwa__opCodeText__153vo4c"
-            ).text.strip()
-            if txt == "PM Gas":
-                driver.execute_script(
-                    "arguments[0].scrollIntoView({block:'center'});", t
-                )
-                t.click()
-                time.sleep(0.3)
-                return True
-        except Exception:
-            continue
-    return False
+    # Tile marks itself selected, or detaches if the dialog advances
+    settle(driver, lambda d: _is_selected_tile(t) or is_stale(t))
+    return True
+
+
+_CREATE_WORK_ITEM_LOC = (By.XPATH, "//button[normalize-space()='Create Work Item']")
 
 
 def create_work_item(driver) -> bool:
     """Click 'Create Work Item'."""
-    locator = (By.XPATH, "//button[normalize-space()='Create Work Item']")
-    return click_element(driver, locator)
+    return click_element(driver, _CREATE_WORK_ITEM_LOC)
+
+
+_NEXT_TEXT_LOC = (By.XPATH, "//button[normalize-space()='Next']")
+_NEXT_CLASS_LOC = (By.CSS_SELECTOR, "button.fleet-operations-pwa__nextButton__153vo4c")
 
 
 def next_step(driver, timeout: int = 10) -> bool:
     """Click the Next button when it is actually enabled."""
     # Prefer visible text; fallback to known class
-    if click_element(driver, (By.XPATH, "//button[normalize-space()='Next']")):
-        time.sleep(0.3)
+    if click_element(driver, _NEXT_TEXT_LOC):
+        # Step transition: Next disables or detaches while the next step loads
+        settle(driver, lambda d: not any(
+            _is_element_enabled(b) for b in d.find_elements(*_NEXT_TEXT_LOC)
+        ))
         return True
-    return click_element(driver, (By.CSS_SELECTOR, "button.fleet-operations-pwa__nextButton__153vo4c"))
+    return click_element(driver, _NEXT_CLASS_LOC)
 
 
 
 def has_complete_of_type(items, ctype: str) -> bool:
     print("[WORKITEM] A total of", len(items), "work items found")
-    log.info(f"[WORKITEM] Checking for completed PM work items of type '{ctype}'")
+    log.info("[WORKITEM] Checking for completed PM work items of type '%s'", ctype)
     result = any(
         it.get("state") == "Complete" and it.get("type") == ctype for it in items
     )
-    log.info(f"[WORKITEM] has_complete_of_type('{ctype}') -> {result}")
+    log.info("[WORKITEM] has_complete_of_type('%s') -> %s", ctype, result)
     return result
 
 
@@ -507,7 +581,7 @@ def has_complete_of_type(items, ctype: str) -> bool:
 
 def find_element(driver, locator, timeout=10):
     """Wait for a single element to appear and return it."""
-    return WebDriverWait(driver, timeout).until(
+    return _wait(driver, timeout).until(
         EC.presence_of_element_located(locator)
     )
 
@@ -516,62 +590,43 @@ def find_element(driver, locator, timeout=10):
 # Overrides for: click_next_in_dialog, click_done, process_pm_workitem_flow
 # ==========================
 
-# Extracted helper functions for click_next_in_dialog refactoring
-def _find_next_button_candidates(driver):
-    """Find all possible 'Next' button candidates using multiple strategies."""
-    # 1) Exact class from your snippet
-    cs = driver.find_elements(
-        By.CSS_SELECTOR, "button.fleet-operations-pwa__nextButton__153vo4c"
-    )
-    # 2) Button with a <p> 'Next' inside (your DOM shape)
-    x1 = driver.find_elements(By.XPATH, "//button[.//p[normalize-space()='Next']]")
-    # 3) Any role=button with that inner <p> text (fallback)
-    x2 = driver.find_elements(
-        By.XPATH, "//*[@role='button' and .//p[normalize-space()='Next']]"
-    )
-    # 4) Last resort: visible text 'Next' on/inside a button-ish thing
-    x3 = driver.find_elements(
-        By.XPATH,
-        "//*[self::button or @role='button'][.//span or .//p][.//p[normalize-space()='Next'] or normalize-space()='Next']",
-    )
-    return cs + x1 + x2 + x3
+# Every known shape of the PM wizard 'Next' button, as one union query
+# (XPath unions come back de-duplicated, in document order)
+_NEXT_BTN_XP = (
+    "//button[contains(@class,'nextButton__153vo4c') or .//p[normalize-space()='Next']]"
+    " | //*[@role='button' and .//p[normalize-space()='Next']]"
+    " | //*[self::button or @role='button'][.//span or .//p][normalize-space()='Next']"
+)
 
-def _deduplicate_elements(elements):
-    """Remove duplicate elements from the list."""
-    seen = set()
+
+def _visible_next_buttons(driver):
+    """Displayed 'Next' button candidates, skipping ones that went stale."""
     out = []
-    for el in elements:
+    for el in driver.find_elements(By.XPATH, _NEXT_BTN_XP):
         try:
-            if not el.is_displayed():
-                continue
-            # de-dupe by id()
-            oid = el.id if hasattr(el, "id") else el
-            if oid in seen:
-                continue
-            seen.add(oid)
-            out.append(el)
+            if el.is_displayed():
+                out.append(el)
         except Exception:
             continue
     return out
+
+
+# arguments[0]: element; true unless disabled natively, via aria-disabled, or by a 'disabled' class
+_IS_ENABLED_JS = """
+const e = arguments[0];
+const aria = String(e.getAttribute('aria-disabled')).toLowerCase();
+return !e.disabled && aria !== 'true' && aria !== '1'
+    && !String(e.getAttribute('class') || '').toLowerCase().includes('disabled');
+"""
+
+
 def _is_element_enabled(el):
-    """Check if element is enabled and not disabled via aria or class."""
+    """Check if element is enabled and not disabled via aria or class (one round trip)."""
     try:
-        if not el.is_enabled():
-            return False
-        aria = el.get_attribute("aria-disabled")
-        if str(aria).lower() in ("true", "1"):
-            return False
-        clz = (el.get_attribute("class") or "").lower()
-        if "disabled" in clz:
-            return False
-        return True
+        return bool(el.parent.execute_script(_IS_ENABLED_JS, el))
     except Exception:
         return False
 
-def _get_best_candidate(candidates):
-    """Get the first enabled candidate from the list."""
-    return next((c for c in candidates if _is_element_enabled(c)), None)
-
 def _scroll_element_into_view(driver, element):
     """Scroll element into view safely."""
     try:
@@ -601,47 +656,73 @@ def _log_candidates_debug_info(candidates):
             clz = c.get_attribute("class") or ""
             aria = c.get_attribute("aria-disabled")
             log.info(
-                f"[NEXT][CAND] #{i} text='{txt}' enabled={c.is_enabled()} aria-disabled={aria} class='{clz}'"
+                "[NEXT][CAND] #%s text='%s' enabled=%s aria-disabled=%s class='%s'",
+                i, txt, c.is_enabled(), aria, clz,
             )
         except Exception:
             pass
 
+def _click_enabled_next(driver):
+    """Wait condition: click the first visible, enabled Next button; the button or False."""
+    for btn in _visible_next_buttons(driver):
+        if _is_element_enabled(btn):
+            _scroll_element_into_view(driver, btn)
+            if _click_element_safely(driver, btn):
+                return btn
+    return False
+
+
 def click_next_in_dialog(driver, timeout: int = 10) -> bool:
     """
-    Find and click the PM wizard 'Next' button using extracted helper methods.
+    Find and click the PM wizard 'Next' button.
     Matches your HTML exactly and no longer requires the bp6-dialog ancestor.
     """
-    # Wait until at least one candidate is present and enabled
-    end = time.time() + timeout
-    print("[NEXT][SCAN] searching for Next button...")    
-    while time.time() < end:
-        # Phase 1: Find and deduplicate candidates
-        raw_candidates = _find_next_button_candidates(driver)
-        candidates = _deduplicate_elements(raw_candidates)
-        
-        if candidates:
-            # Phase 2: Log debug information
-            _log_candidates_debug_info(candidates)
-            
-            # Phase 3: Find best enabled candidate
-            best_button = _get_best_candidate(candidates)
-            
-            if best_button:
-                # Phase 4: Execute click operation
-                _scroll_element_into_view(driver, best_button)
-                
-                if _click_element_safely(driver, best_button):
-                    print("[NEXT] Clicked Next.")
-                    time.sleep(0.3)
-                    return True
-        
-        time.sleep(0.2)
+    log.debug("[NEXT][SCAN] searching for Next button...")
+    try:
+        btn = WebDriverWait(driver, timeout, poll_frequency=0.15).until(_click_enabled_next)
+    except TimeoutException:
+        # Final failure case - one dump of what was there
+        candidates = _visible_next_buttons(driver)
+        _log_candidates_debug_info(candidates)
+        log.error("[NEXT][ERROR] No enabled Next button found. candidates=%s", len(candidates))
+        return False
+
+    log.info("[NEXT] Clicked Next.")
+    # Next disables or detaches while the next step loads
+    settle(driver, lambda d: not _is_element_enabled(btn))
+    return True
+
+
+# First rendered, non-hidden wizard dialog, or null
+_VISIBLE_DIALOG_JS = """
+for (const d of document.querySelectorAll("div[class*='bp6-dialog']")) {
+    const r = d.getBoundingClientRect();
+    if (r.width && r.height && getComputedStyle(d).visibility !== 'hidden') return d;
+}
+return null;
+"""
 
-    # Final failure case - one last dump before failing
-    final_candidates = _find_next_button_candidates(driver)
-    final_deduplicated = _deduplicate_elements(final_candidates)
-    log.error(f"[NEXT][ERROR] No enabled Next button found. candidates={len(final_deduplicated)}")
-    return False
+
+def _visible_dialog(driver):
+    """The first visible bp6 dialog in one round trip, instead of is_displayed() per match."""
+    return driver.execute_script(_VISIBLE_DIALOG_JS)
+
+
+# Buttons that end the wizard, in order of preference
+_DONE_BTN_LOCS = tuple(
+    (By.XPATH, "//div[contains(@class,'bp6-dialog')]" + xp)
+    for xp in (
+        "//button[normalize-space()='Done']",
+        "//span[normalize-space()='Done']/ancestor::button[1]",
+        "//*[@role='button' and normalize-space()='Done']",
+        "//button[normalize-space()='Finish']",
+        "//button[normalize-space()='Close']",
+    )
+)
+_DIALOG_CLOSE_LOC = (
+    By.XPATH,
+    "//div[contains(@class,'bp6-dialog')]//button[contains(@class,'close') or @aria-label='Close']",
+)
 
 
 def click_done(driver, timeout: int = 8) -> bool:
@@ -649,25 +730,13 @@ def click_done(driver, timeout: int = 8) -> bool:
     Click 'Done' if the wizard is open; if no dialog visible, consider it already done.
     """
 
-    dialogs = [
-        el
-        for el in driver.find_elements(By.CSS_SELECTOR, "div[class*='bp6-dialog']")
-        if el.is_displayed()
-    ]
-    if not dialogs:
+    if not _visible_dialog(driver):
         return True
 
-    xpaths = [
-        "//div[contains(@class,'bp6-dialog')]//button[normalize-space()='Done']",
-        "//div[contains(@class,'bp6-dialog')]//span[normalize-space()='Done']/ancestor::button[1]",
-        "//div[contains(@class,'bp6-dialog')]//*[@role='button' and normalize-space()='Done']",
-        "//div[contains(@class,'bp6-dialog')]//button[normalize-space()='Finish']",
-        "//div[contains(@class,'bp6-dialog')]//button[normalize-space()='Close']",
-    ]
-    for xp in xpaths:
+    for locator in _DONE_BTN_LOCS:
         try:
             btn = WebDriverWait(driver, timeout).until(
-                EC.element_to_be_clickable((By.XPATH, xp))
+                EC.element_to_be_clickable(locator)
             )
             driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
             try:
@@ -682,12 +751,7 @@ def click_done(driver, timeout: int = 8) -> bool:
     # Last resort: dialog close icon
     try:
         close_btn = WebDriverWait(driver, 2).until(
-            EC.element_to_be_clickable(
-                (
-                    By.XPATH,
-                    "//div[contains(@class,'bp6-dialog')]//button[contains(@class,'close') or @aria-label='Close']",
-                )
-            )
+            EC.element_to_be_clickable(_DIALOG_CLOSE_LOC)
         )
         close_btn.click()
         time.sleep(0.2)
@@ -721,27 +785,54 @@ def click_done(driver, timeout: int = 8) -> bool:
 
 
 
+_CAMERA_BTN_LOC = (By.XPATH, "//button[contains(@class,'fleet-operations-pwa__camera-button')]")
+_BACK_BTN_LOC = (By.XPATH, "//button[contains(@class,'fleet-operations-pwa__back-button')]")
+# What identifies the current view: URL, first heading, back-arrow count, and whether
+# home (camera button) is showing. Compared before/after a back click; survives the SPA
+# reusing the arrow node, which a staleness check does not.
+_VIEW_STATE_JS = """
+const h = document.querySelector('h1, h2');
+return {
+    href: location.href,
+    heading: h ? h.textContent.trim() : '',
+    arrows: document.querySelectorAll("button[class*='fleet-operations-pwa__back-button']").length,
+    home: !!document.querySelector("button[class*='fleet-operations-pwa__camera-button']"),
+};
+"""
+
+
+def _view_changed(before: dict):
+    """Wait condition: the view differs from before, or home is showing."""
+    def _changed(driver):
+        now = driver.execute_script(_VIEW_STATE_JS)
+        return now["home"] or now != before
+    return _changed
+
+
 def navigate_back_to_home(driver, max_clicks: int = 5) -> bool:
     """Click the back arrow until the home screen (camera button visible) is reached."""
     for i in range(max_clicks):
         try:
-            if driver.find_elements(By.XPATH, "//button[contains(@class,'fleet-operations-pwa__camera-button')]"):
+            if driver.find_elements(*_CAMERA_BTN_LOC):
                 log.info("[NAV] back at MVA input screen (camera button visible)")
                 return True
         except StaleElementReferenceException:
             pass # Element is stale, try again
 
         try:
-            arrows = driver.find_elements(By.XPATH, "//button[contains(@class,'fleet-operations-pwa__back-button')]")
+            arrows = driver.find_elements(*_BACK_BTN_LOC)
             if arrows:
+                before = driver.execute_script(_VIEW_STATE_JS)
                 arrows[0].click()
-                log.info(f"[NAV] back arrow clicked ({i+1}/{max_clicks})")
-                time.sleep(1.5)  # settle
+                log.info("[NAV] back arrow clicked (%s/%s)", i+1, max_clicks)
+                # View transition, bounded by the old 1.5s settle sleep
+                if not settle(driver, _view_changed(before), max_wait=1.5):
+                    log.debug("[NAV] view unchanged 1.5s after back click")
             else:
                 log.info("[NAV] no back arrow visible")
                 break
         except Exception as e:
-            log.warning(f"[NAV][WARN] could not click back arrow -> {e}")
+            log.warning("[NAV][WARN] could not click back arrow -> %s", e)
             return False
 
     log.warning("[NAV][FAIL] did not return to home screen (camera button not found)")
@@ -760,5 +851,5 @@ def take_screenshot(driver, prefix="screenshot"):
 
     os.makedirs(os.path.dirname(path), exist_ok=True)
     driver.save_screenshot(path)
-    log.info(f"[DEBUG] Screenshot saved -> {path}")
+    log.info("[DEBUG] Screenshot saved -> %s", path)
     return path
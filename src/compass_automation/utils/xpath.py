@@ -0,0 +1,12 @@
+# utils/xpath.py
+# XPath string helpers; no selenium import, so selenium-optional pages can use them.
+
+
+def xpath_literal(text: str) -> str:
+    """Quote text as an XPath string literal, using concat() when it has both quote kinds."""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in parts) + ")"
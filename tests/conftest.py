@@ -18,3 +18,23 @@ def _quit_browser_after_session():
     yield
     print("[FIXTURE] All tests complete -- quitting singleton driver...")
     driver_manager.quit_driver()
+
+
+@pytest.fixture(scope="session")
+def driver(request):
+    """
+    One Edge instance per test process.
+
+    Under pytest-xdist (``pytest -n auto``) each worker gets its own driver on
+    its own persistent profile; WebDriver sessions are not shared across
+    processes. Without xdist this is the usual singleton.
+    """
+    worker_id = getattr(request.config, "workerinput", {}).get("workerid")
+    if worker_id is None:
+        yield driver_manager.get_or_create_driver()
+        return
+    drv = driver_manager.create_driver(
+        user_data_dir=f"{driver_manager.PROFILE_DIR}_{worker_id}"
+    )
+    yield drv
+    drv.quit()
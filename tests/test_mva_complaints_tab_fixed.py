@@ -3,13 +3,12 @@ import time
 import pytest
 from selenium.webdriver.common.by import By
 from compass_automation.config.config_loader import get_config
-from compass_automation.core import driver_manager
 from compass_automation.pages.login_page import LoginPage
 from compass_automation.pages.mva_input_page import MVAInputPage
 from compass_automation.utils.data_loader import load_mvas
 from compass_automation.utils.logger import log
 from compass_automation.utils.project_paths import ProjectPaths
-from compass_automation.utils.ui_helpers import navigate_back_to_home, is_mva_known
+from compass_automation.utils.ui_helpers import navigate_back_to_home, get_vehicle_snapshot
 from compass_automation.utils.test_validation import TestDataValidator
 
 # Load config values
@@ -20,7 +19,7 @@ DELAY = get_config("delay_seconds", default=2)
 
 
 @pytest.mark.smoke
-def test_mva_complaints_tab():
+def test_mva_complaints_tab(driver):
     print("Starting test_mva_complaints_tab...")
     
     # Add clear test session header
@@ -36,8 +35,7 @@ def test_mva_complaints_tab():
     log.info(f"🧪 Test: test_mva_complaints_tab")
     log.info("=" * 80)
 
-    # Initialize driver
-    driver = driver_manager.get_or_create_driver()
+    # Driver comes from the session fixture (one per xdist worker)
     log.info(f"Driver initialized: {driver}")
 
     # Perform login
@@ -74,16 +72,16 @@ def test_mva_complaints_tab():
 
         time.sleep(5)
 
-        from compass_automation.utils.ui_helpers import is_mva_known, get_lighthouse_status
-        if not is_mva_known(driver, mva):
+        # One wait gives both the known/unknown gate and the Lighthouse status
+        snapshot = get_vehicle_snapshot(driver, mva)
+        if not snapshot["known"]:
             log.warning(f"[MVA] {mva} — invalid/unknown MVA, skipping")
             continue
 
         # Check Lighthouse status for early exit
-        # lighthouse_status = get_ lighthouse_status(driver, mva)
-        # if lighthouse_status == "Rentable":
-        #     log.info(f"[MVA] {mva} — Lighthouse status is 'Rentable', skipping further processing.")
-        #     continue
+        if snapshot["lighthouse"] == "Rentable":
+            log.info(f"[MVA] {mva} — Lighthouse status is 'Rentable', skipping further processing.")
+            continue
 
         # Handle PM Work Items in one call
         from compass_automation.flows.work_item_flow import handle_pm_workitems
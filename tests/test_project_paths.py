@@ -17,10 +17,6 @@ from compass_automation.utils.project_paths import ProjectPaths, get_config_file
 class TestProjectPaths:
     """Test cases for ProjectPaths utility class."""
     
-    def setup_method(self):
-        """Reset ProjectPaths cache before each test."""
-        ProjectPaths._project_root = None
-    
     def test_get_project_root_returns_path_object(self):
         """Test that get_project_root returns a Path object."""
         root = ProjectPaths.get_project_root()
@@ -76,6 +72,10 @@ class TestProjectPaths:
         assert data_path.name == "mva.csv"
         assert data_path.parent.name == "data"
     
+    def test_directory_paths_are_cached(self):
+        """Test that directory paths are built once and reused."""
+        assert ProjectPaths.get_data_path() is ProjectPaths.get_data_path()
+    
     def test_get_logs_path_without_filename(self):
         """Test get_logs_path returns logs directory when no filename provided."""
         logs_path = ProjectPaths.get_logs_path()
@@ -154,10 +154,6 @@ class TestProjectPaths:
 class TestBackwardCompatibilityFunctions:
     """Test backward compatibility convenience functions."""
     
-    def setup_method(self):
-        """Reset ProjectPaths cache before each test."""
-        ProjectPaths._project_root = None
-    
     def test_get_config_file_path_returns_string(self):
         """Test that get_config_file_path returns string path."""
         config_path = get_config_file_path()
@@ -192,10 +188,6 @@ class TestBackwardCompatibilityFunctions:
 class TestPathResolutionEdgeCases:
     """Test edge cases and error conditions."""
     
-    def setup_method(self):
-        """Reset ProjectPaths cache before each test."""
-        ProjectPaths._project_root = None
-    
     def test_paths_are_cross_platform_compatible(self):
         """Test that paths work on different operating systems."""
         config_path = ProjectPaths.get_config_path("test.json")
@@ -219,27 +211,21 @@ class TestPathResolutionEdgeCases:
     
     @patch('compass_automation.utils.project_paths.Path')
     def test_project_root_calculation_logic(self, mock_path):
-        """Test the project root calculation logic."""
-        # Mock the __file__ path to simulate being in src/compass_automation/utils/project_paths.py
-        mock_file_path = Path("/fake/project/src/compass_automation/utils/project_paths.py")
-        mock_path.return_value.parent.parent.parent.parent.resolve.return_value = Path("/fake/project")
+        """Test the project root is resolved once at import, not per call."""
+        from compass_automation.utils import project_paths
         
-        # Reset cache and call method
-        ProjectPaths._project_root = None
-        with patch('compass_automation.utils.project_paths.__file__', str(mock_file_path)):
-            root = ProjectPaths.get_project_root()
+        root = ProjectPaths.get_project_root()
         
-        # Should have called the path resolution logic (4 levels up)
-        assert mock_path.return_value.parent.parent.parent.parent.resolve.called
+        # No Path construction or resolve() on the call path
+        assert not mock_path.called
+        assert root is project_paths._PROJECT_ROOT
+        # Four levels up from src/compass_automation/utils/project_paths.py
+        assert root == Path(project_paths.__file__).resolve().parents[3]
 
 
 class TestIntegrationWithExistingCode:
     """Integration tests to ensure ProjectPaths works with existing codebase."""
     
-    def setup_method(self):
-        """Reset ProjectPaths cache before each test."""
-        ProjectPaths._project_root = None
-    
     def test_config_path_matches_expected_location(self):
         """Test that config path points to actual config directory."""
         config_path = ProjectPaths.get_config_path()
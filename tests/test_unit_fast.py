@@ -36,6 +36,17 @@ class TestConfigLoader:
         with pytest.raises(KeyError):
             get_config("totally_missing_key")
 
+    def test_get_config_nested_and_subtree(self):
+        """Test dotted keys resolve to leaves and parent keys to subtrees."""
+        from compass_automation.config.config_loader import get_config
+
+        logging_cfg = get_config("logging")
+        assert isinstance(logging_cfg, dict)
+        assert get_config("logging.level") == logging_cfg["level"]
+
+        with pytest.raises(KeyError, match="nested"):
+            get_config("logging.missing_leaf")
+
 
 class TestDataLoader:
     """Test utils/data_loader.py functionality."""
@@ -94,6 +105,22 @@ class TestDataLoader:
         finally:
             os.unlink(temp_path)
 
+    def test_iter_mvas_is_lazy(self):
+        """Test iter_mvas streams rows and skips blanks/comments."""
+        from compass_automation.utils.data_loader import iter_mvas
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("# header\n12345678\n\n 87654321 \n")
+            temp_path = f.name
+
+        try:
+            mvas = iter_mvas(temp_path)
+            assert not isinstance(mvas, list)
+            assert next(mvas) == "12345678"
+            assert list(mvas) == ["87654321"]
+        finally:
+            os.unlink(temp_path)
+
 
 class TestDomainObjects:
     """Test domain objects in pages/ directory."""
@@ -132,6 +159,15 @@ class TestDomainObjects:
         assert work_item.is_complete()
         assert work_item.age_in_days() is not None
     
+    def test_work_item_keeps_status_text(self):
+        """Test WorkItem matches status case-insensitively without rewriting it."""
+        from compass_automation.pages.work_item import WorkItem
+
+        assert WorkItem(id="1", type="PM", status="In Progress").status == "In Progress"
+        item = WorkItem(id="2", type="PM", status="OPEN")
+        assert item.status == "OPEN"
+        assert item.is_open() and not item.is_complete()
+
     def test_vehicle_creation(self):
         """Test Vehicle object creation and methods."""
         from compass_automation.pages.vehicle import Vehicle
@@ -146,6 +182,17 @@ class TestDomainObjects:
         assert vehicle.plate == "ABC123"
         assert vehicle.age_in_days() is not None
 
+    def test_vehicle_ages_for_batch(self):
+        """Test Vehicle.ages_for uses one reference time for all vehicles."""
+        from compass_automation.pages.vehicle import Vehicle
+
+        now = datetime(2024, 1, 31)
+        vehicles = [
+            Vehicle(mva="1", purchase_date=datetime(2024, 1, 1)),
+            Vehicle(mva="2"),
+        ]
+        assert Vehicle.ages_for(vehicles, now=now) == [30, None]
+
 
 class TestDriverManagerVersions:
     """Test driver_manager.py version checking logic (without browser)."""
@@ -187,6 +234,7 @@ class TestDriverManagerVersions:
     def test_get_browser_version_success(self, mock_query, mock_open):
         """Test successful browser version extraction."""
         from compass_automation.core.driver_manager import get_browser_version
+        get_browser_version.cache_clear()
         
         mock_query.return_value = ("142.0.3595.65", None)
         
@@ -197,6 +245,7 @@ class TestDriverManagerVersions:
     def test_get_browser_version_registry_error(self, mock_open):
         """Test browser version when registry access fails."""
         from compass_automation.core.driver_manager import get_browser_version
+        get_browser_version.cache_clear()
         
         mock_open.side_effect = Exception("Registry error")
         
@@ -204,6 +253,68 @@ class TestDriverManagerVersions:
         assert version == "unknown"
 
 
+class TestDriverVersionParsing:
+    """Test DriverVersion parsing used for browser/driver major comparison."""
+
+    def test_parse_full_version(self):
+        """Test parsing a four-part version string into integer parts."""
+        from compass_automation.core.driver_downloader import DriverVersion
+
+        version = DriverVersion.parse("142.0.3595.65")
+        assert version.parts == (142, 0, 3595, 65)
+        assert version.major == 142
+        assert str(version) == "142.0.3595.65"
+
+    def test_parse_unknown_returns_none(self):
+        """Test that 'unknown' and empty inputs are not parsed."""
+        from compass_automation.core.driver_downloader import DriverVersion
+
+        assert DriverVersion.parse("unknown") is None
+        assert DriverVersion.parse("") is None
+        assert DriverVersion.parse(None) is None
+
+    def test_major_comparison_is_integer_based(self):
+        """Test that majors compare as integers, not strings."""
+        from compass_automation.core.driver_downloader import DriverVersion
+
+        assert DriverVersion.parse("142.0.1.1").major == DriverVersion.parse("142.9.9.9").major
+        assert DriverVersion.parse("99.0.0.0").major < DriverVersion.parse("100.0.0.0").major
+
+    def test_ensure_driver_ready_uses_stamp(self, tmp_path):
+        """Test that a matching stamp file skips the driver --version probe."""
+        from compass_automation.core.driver_downloader import DriverDownloader
+
+        driver_path = tmp_path / "msedgedriver.exe"
+        driver_path.write_text("")
+        stamp_path = tmp_path / "msedgedriver.ok"
+        stamp_path.write_text(json.dumps({"mtime": os.path.getmtime(driver_path), "major": 142}))
+
+        with patch.object(DriverDownloader, "DRIVER_PATH", driver_path), \
+             patch.object(DriverDownloader, "STAMP_PATH", stamp_path), \
+             patch.object(DriverDownloader, "get_browser_version", return_value="142.0.3595.65"), \
+             patch.object(DriverDownloader, "get_driver_version") as mock_driver_ver:
+            assert DriverDownloader.ensure_driver_ready() is True
+            mock_driver_ver.assert_not_called()
+
+    @patch('subprocess.check_output')
+    def test_driver_version_from_file_info(self, mock_subprocess, tmp_path):
+        """Test that PE file version info is used before spawning the driver."""
+        from compass_automation.core import driver_downloader
+        from compass_automation.core.driver_downloader import DriverDownloader
+
+        driver_path = tmp_path / "msedgedriver.exe"
+        driver_path.write_text("")
+        fake_win32api = MagicMock()
+        fake_win32api.GetFileVersionInfo.return_value = {
+            "FileVersionMS": (142 << 16) | 0,
+            "FileVersionLS": (3595 << 16) | 65,
+        }
+
+        with patch.object(driver_downloader, "win32api", fake_win32api):
+            assert DriverDownloader.get_driver_version(driver_path) == "142.0.3595.65"
+        mock_subprocess.assert_not_called()
+
+
 class TestLoggerConfiguration:
     """Test logger configuration and color formatting."""
     
@@ -242,6 +353,24 @@ class TestLoggerConfiguration:
         formatted = formatter.format(record)
         assert "INFO: Test message" in formatted
 
+    def test_cached_time_formatter_reuses_second(self):
+        """Test asctime is rendered once per second and refreshed on the next."""
+        import logging
+        from compass_automation.utils.logger import CachedTimeFormatter
+
+        formatter = CachedTimeFormatter("%(asctime)s", datefmt="%H:%M:%S")
+        record = logging.LogRecord("test", logging.INFO, "", 0, "msg", (), None)
+        record.created = 1_700_000_000.1
+
+        with patch.object(logging.Formatter, "formatTime", return_value="first") as mock_fmt:
+            assert formatter.formatTime(record, "%H:%M:%S") == "first"
+            record.created += 0.5
+            assert formatter.formatTime(record, "%H:%M:%S") == "first"
+            assert mock_fmt.call_count == 1
+            record.created += 1
+            formatter.formatTime(record, "%H:%M:%S")
+            assert mock_fmt.call_count == 2
+
 
 class TestHelperFunctions:
     """Test utility helper functions that don't require Selenium."""
@@ -265,6 +394,247 @@ class TestHelperFunctions:
         finally:
             os.unlink(temp_path)
 
+    def test_xpath_literal_quoting(self):
+        """Test XPath literal quoting for values containing quotes."""
+        from compass_automation.utils.ui_helpers import xpath_literal
+
+        assert xpath_literal("PM Gas") == "'PM Gas'"
+        assert xpath_literal("Driver's seat") == '"Driver\'s seat"'
+        assert xpath_literal("a'b\"c") == "concat('a', \"'\", 'b\"c')"
+
+    def test_get_work_items_returns_batch(self):
+        """Test get_work_items wraps the in-page scrape in a WorkItemBatch."""
+        from compass_automation.flows.work_item_flow import get_work_items, WorkItemBatch
+
+        driver = MagicMock()
+        header = MagicMock()
+        driver.find_element.return_value = header
+        driver.execute_script.return_value = {
+            "elements": [header], "titles": ["PM"], "statuses": ["Open"],
+        }
+
+        batch = get_work_items(driver, "12345678")
+        assert isinstance(batch, WorkItemBatch)
+        assert len(batch) == 1 and batch
+        assert batch.titles == ["PM"] and batch.statuses == ["Open"]
+        assert not WorkItemBatch()
+
+    def test_get_work_items_empty_list_returns_early(self):
+        """Test get_work_items stops waiting once the empty list's Add Work Item button renders."""
+        import time
+        from selenium.common.exceptions import NoSuchElementException
+        from compass_automation.flows.work_item_flow import get_work_items, _ADD_WORKITEM_BTN_LOC
+
+        driver = MagicMock()
+        driver.find_elements.side_effect = lambda by, value: ["btn"] if (by, value) == _ADD_WORKITEM_BTN_LOC else []
+        driver.find_element.side_effect = NoSuchElementException()
+
+        start = time.monotonic()
+        assert not get_work_items(driver, "12345678")
+        assert time.monotonic() - start < 5
+        driver.execute_script.assert_not_called()
+
+    def test_complete_work_item_dialog_waits_for_complete_status(self):
+        """Test complete_work_item_dialog returns once the PM work item reports Complete."""
+        from selenium.webdriver.remote.webelement import WebElement
+        from compass_automation.flows.work_item_flow import complete_work_item_dialog, _PM_COMPLETE_JS
+
+        dialog, textarea, button = (MagicMock(spec=WebElement) for _ in range(3))
+        dialog.is_displayed.return_value = False
+        button.is_displayed.return_value = True
+        driver = MagicMock()
+        # Already one completed PM item: the wait must see a second one appear
+        driver.execute_script.side_effect = [[dialog, textarea, button], 1, 1, 2]
+
+        assert complete_work_item_dialog(driver, note="Done", timeout=2) == {"status": "ok"}
+        textarea.send_keys.assert_called_once_with("Done")
+        button.click.assert_called_once()
+        assert driver.execute_script.call_args.args == (_PM_COMPLETE_JS,)
+
+    def test_enter_mileage_clicks_dialog_next_via_click_element(self):
+        """Test enter_mileage sets the value in-page, then clicks the dialog-scoped Next."""
+        from compass_automation.flows import mileage_flows
+
+        driver = MagicMock()
+        driver.execute_script.return_value = True
+        with patch.object(mileage_flows, "click_element", return_value=True) as click:
+            assert mileage_flows.enter_mileage(driver, "12345678", 42000) == {"status": "ok"}
+        assert driver.execute_script.call_args.args[2] == "42000"
+        assert click.call_args.args[1] == mileage_flows._MILEAGE_NEXT_LOC
+
+        driver.execute_script.return_value = False
+        assert mileage_flows.enter_mileage(driver, "12345678", 1)["reason"] == "mileage_input"
+
+    def test_wait_for_tiles_stable_returns_settled_count(self):
+        """Test wait_for_tiles_stable polls until the tile count stops changing."""
+        from compass_automation.utils.ui_helpers import wait_for_tiles_stable
+
+        driver = MagicMock()
+        driver.find_elements.side_effect = [["a"], ["a", "b"], ["a", "b"]]
+
+        assert wait_for_tiles_stable(driver, "div.tile", min_stable_ms=0, timeout=2) == 2
+        assert driver.find_elements.call_count == 3
+
+    def test_click_next_in_dialog_clicks_first_enabled(self):
+        """Test click_next_in_dialog skips disabled candidates from the union query."""
+        from compass_automation.utils.ui_helpers import click_next_in_dialog
+
+        disabled, enabled = MagicMock(), MagicMock()
+        disabled.parent.execute_script.return_value = False
+        enabled.parent.execute_script.return_value = True
+        driver = MagicMock()
+        driver.find_elements.return_value = [disabled, enabled]
+
+        assert click_next_in_dialog(driver, timeout=1) is True
+        enabled.click.assert_called_once()
+        disabled.click.assert_not_called()
+        assert driver.find_elements.call_count == 1
+
+    def test_click_done_without_visible_dialog(self):
+        """Test click_done returns early after one visible-dialog script call."""
+        from compass_automation.utils.ui_helpers import click_done
+
+        driver = MagicMock()
+        driver.execute_script.return_value = None
+        assert click_done(driver) is True
+        driver.execute_script.assert_called_once()
+        driver.find_elements.assert_not_called()
+
+    def test_navigate_back_to_home_waits_for_view_change(self):
+        """Test navigate_back_to_home moves on as soon as the view state changes."""
+        from compass_automation.utils import ui_helpers
+
+        arrow, camera = MagicMock(), MagicMock()
+        view = {"href": "x", "heading": "Work Items", "arrows": 1, "home": False}
+        driver = MagicMock()
+        driver.find_elements.side_effect = [[], [arrow], [camera]]
+        # Same arrow node reused; the heading change alone counts as a transition
+        driver.execute_script.side_effect = [view, dict(view, heading="Vehicle")]
+
+        with patch.object(ui_helpers.time, "sleep") as sleep:
+            assert ui_helpers.navigate_back_to_home(driver) is True
+        arrow.click.assert_called_once()
+        arrow.is_enabled.assert_not_called()
+        sleep.assert_not_called()
+
+    def test_wait_is_cached_per_driver_and_timeout(self):
+        """Test the getters share one fast-polling WebDriverWait per driver and timeout."""
+        from compass_automation.utils.ui_helpers import _wait, _FAST_POLL
+
+        driver = MagicMock()
+        w = _wait(driver, 5)
+        assert _wait(driver, 5) is w
+        assert _wait(driver, 6) is not w
+        assert _wait(MagicMock(), 5) is not w
+        assert w._poll == _FAST_POLL
+
+    def test_select_opcode_pm_gas_single_query(self):
+        """Test select_opcode_pm_gas locates the PM Gas tile without per-tile reads."""
+        from compass_automation.utils.ui_helpers import select_opcode_pm_gas
+
+        tile = MagicMock()
+        tile.parent.execute_script.return_value = True  # selected after click
+        driver = MagicMock()
+        driver.find_element.return_value = tile
+
+        assert select_opcode_pm_gas(driver, timeout=1) is True
+        tile.click.assert_called_once()
+        tile.find_element.assert_not_called()
+        assert "PM Gas" in driver.find_element.call_args.args[1]
+
+    def test_drivability_click_next_tolerates_reused_button(self):
+        """Test DrivabilityPage.click_next does not raise when Next stays visible."""
+        from selenium.webdriver.remote.webelement import WebElement
+        from compass_automation.pages.drivability_page import DrivabilityPage
+
+        next_btn = MagicMock(spec=WebElement)
+        next_btn.is_displayed.return_value = True
+        driver = MagicMock()
+        driver.execute_script.return_value = next_btn
+
+        DrivabilityPage(driver).click_next()
+        next_btn.click.assert_called_once()
+
+    def test_get_vehicle_snapshot_single_async_wait(self):
+        """Test get_vehicle_snapshot resolves known + Lighthouse in one async script."""
+        from selenium.common.exceptions import WebDriverException
+        from compass_automation.utils.ui_helpers import get_vehicle_snapshot
+
+        driver = MagicMock()
+        driver.execute_async_script.return_value = {"known": True, "lighthouse": "Rentable"}
+        assert get_vehicle_snapshot(driver, "1234567890", timeout=3) == {"known": True, "lighthouse": "Rentable"}
+        _, last8, timeout_ms, grace_ms = driver.execute_async_script.call_args.args
+        assert (last8, timeout_ms, grace_ms) == ("34567890", 3000, 2000)
+
+        driver.execute_async_script.side_effect = WebDriverException("boom")
+        assert get_vehicle_snapshot(driver, "1234567890") == {"known": False, "lighthouse": None}
+
+    def test_performance_summary_filters_by_name(self):
+        """Test get_summary aggregates the metric columns, optionally by name."""
+        from compass_automation.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor()
+        for name in ("login", "login", "lookup"):
+            monitor.end_metric(monitor.start_metric(name))
+
+        assert monitor.get_summary().operation_count == 3
+        summary = monitor.get_summary("login")
+        assert summary.operation_count == 2
+        assert summary.total_duration == pytest.approx(sum(m.duration for m in monitor.metrics[:2]))
+        assert monitor.get_summary("missing").operation_count == 0
+
+        monitor.clear_metrics()
+        assert monitor.get_summary().operation_count == 0
+
+    def test_performance_summary_without_details(self):
+        """Test a monitor without retained details summarizes from running totals."""
+        from compass_automation.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor(retain_details=False)
+        durations = [monitor.end_metric(monitor.start_metric("op")).duration for _ in range(3)]
+
+        summary = monitor.get_summary()
+        assert monitor.metrics == []
+        assert summary.operation_count == 3
+        assert summary.min_duration == min(durations)
+        assert summary.max_duration == max(durations)
+        assert summary.average_duration == pytest.approx(sum(durations) / 3)
+        with pytest.raises(ValueError):
+            monitor.get_summary("op")
+
+    def test_measure_function_records_success_and_error(self):
+        """Test the measure_function decorator finishes the metric on every exit path."""
+        from compass_automation.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor()
+
+        @monitor.measure_function("op", {"suite": "unit"})
+        def op(fail=False):
+            if fail:
+                raise RuntimeError("boom")
+            return "done"
+
+        assert op() == "done"
+        with pytest.raises(RuntimeError):
+            op(fail=True)
+
+        assert monitor.active_metrics == {}
+        assert [m.metadata.get("error") for m in monitor.metrics] == [None, "boom"]
+        assert monitor.metrics[0].metadata == {"suite": "unit"}
+
+    def test_resource_samples_ring_keeps_newest(self):
+        """Test the resource sample ring evicts the oldest samples in order."""
+        from compass_automation.utils.performance_monitor import _ResourceSamples
+
+        samples = _ResourceSamples(capacity=3)
+        for i in range(5):
+            samples.append(float(i), 100.0 + i, 1.0, i)
+
+        assert len(samples) == 3
+        rows = samples.to_list()
+        assert [row["timestamp"] for row in rows] == [2.0, 3.0, 4.0]
+        assert rows[-1] == {"timestamp": 4.0, "memory_mb": 104.0, "cpu_percent": 1.0, "threads": 4}
+
 
 # Quick smoke tests for import validation
 class TestImports:
@@ -18,7 +18,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-from compass_automation.core.driver_downloader import DriverDownloader
+from compass_automation.core.driver_downloader import DriverDownloader, DriverVersion
 from compass_automation.utils.logger import log
 
 
@@ -45,8 +45,14 @@ def check_versions():
         print("\n❌ Driver not found or cannot determine version")
         return False
 
-    browser_major = browser_ver.split(".")[0]
-    driver_major = driver_ver.split(".")[0]
+    browser_parsed = DriverVersion.parse(browser_ver)
+    driver_parsed = DriverVersion.parse(driver_ver)
+    if not (browser_parsed and driver_parsed):
+        print("\n❌ Could not parse version numbers")
+        return False
+
+    browser_major = browser_parsed.major
+    driver_major = driver_parsed.major
 
     if browser_major == driver_major:
         print(f"\n✅ MATCH: Browser and driver versions are compatible!")